@@ -0,0 +1,62 @@
+import time
+
+from updated_utils import (
+    clean_text,
+    split_sentences,
+    encode,
+    document_embedding,
+    build_jd_profile,
+    score_resume,
+)
+from resume_structure import analyze_structure
+
+# Keeps everything derived from one resume (structure, cleaned text,
+# sentences, their embeddings) so editing the JD only costs work proportional to the edit:
+# JD sentences seen before are reused and skill phrases come from the
+# precomputed taxonomy vectors.
+
+
+class AnalysisSession:
+    def __init__(self, raw_text, key=None, document=None):
+        # document: parse_document() output, reused instead of re-cleaning
+        self.key = key
+        self.raw_text = raw_text
+        self.structure = analyze_structure(raw_text)
+        if document is not None:
+            self.resume_clean = document["clean"]
+            self.sentences = document["sentences"]
+        else:
+            self.resume_clean = clean_text(raw_text)
+            self.sentences = split_sentences(self.resume_clean)
+
+        self.sentence_embeddings = None
+        self.embedding = None
+        if self.sentences:
+            self.sentence_embeddings = encode(self.sentences)
+            self.embedding = document_embedding(self.sentences, self.sentence_embeddings)
+
+        self._jd_sentences = {}
+        self._last = None
+        self.last_latency_ms = 0.0
+
+    def score(self, jd_text):
+        # Same result as calculate_match_score(raw_text, jd_text)
+        start = time.perf_counter()
+        if self._last is not None and self._last[0] == jd_text:
+            self.last_latency_ms = (time.perf_counter() - start) * 1000
+            return self._last[1]
+
+        if not self.sentences:
+            result = (0, [], [])
+        else:
+            # Unchanged JD sentences reuse their skill hits and are
+            # embedding-cache hits
+            profile = build_jd_profile(jd_text, self._jd_sentences)
+            if not profile["skills"]:
+                result = (0, [], [])
+            else:
+                result = score_resume(self.resume_clean, self.sentence_embeddings, self.embedding, profile)
+
+        self._last = (jd_text, result)
+        self.last_latency_ms = (time.perf_counter() - start) * 1000
+        return result
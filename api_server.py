@@ -0,0 +1,342 @@
+import os
+import io
+import json
+import sys
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from aiohttp import web
+
+import models
+import tracing
+from document_parser import MAX_UPLOAD_BYTES, DocumentTooLargeError
+
+# Headless scoring API for ATS integration:
+#
+#   POST /score        multipart: resume (file) or resume_text, jd
+#                      or JSON: {"resume_text": ..., "jd_text": ...}
+#   POST /score/batch  multipart: resume (repeated files), jd
+#                      or JSON: {"jd_text": ..., "resumes": [{"candidate": ..., "text": ...}]}
+#   GET  /health       warm-up state of the shared model registry
+#
+# Uploads are streamed with a byte limit, then parsed and scored in a thread
+# pool so the event loop only does I/O. Admission is bounded: requests beyond
+# MAX_IN_FLIGHT + MAX_QUEUED get 429 instead of piling up.
+#
+#   python api_server.py --port 8080
+#   python api_server.py --engine classic   # TF-IDF engine, no encoder weights
+
+MAX_IN_FLIGHT = int(os.environ.get("SKILLSYNC_API_MAX_IN_FLIGHT", os.cpu_count() or 1))
+MAX_QUEUED = int(os.environ.get("SKILLSYNC_API_MAX_QUEUED", 32))
+REQUEST_TIMEOUT = float(os.environ.get("SKILLSYNC_API_TIMEOUT", 30))
+# JSON bodies are buffered whole; multipart uploads are streamed per part
+MAX_JSON_BYTES = int(os.environ.get("SKILLSYNC_API_MAX_JSON_BYTES", 16 * 1024 * 1024))
+MAX_BATCH_RESUMES = 200
+CHUNK_SIZE = 64 * 1024
+
+
+# ---------------- ENGINES ----------------
+def _score_semantic(resume_text, jd_text):
+    from updated_utils import calculate_match_score
+
+    return calculate_match_score(resume_text, jd_text)
+
+
+def _screen_semantic(resumes, jd_text):
+    from updated_utils import screen_many
+
+    return screen_many(resumes, jd_text).to_dict(orient="records")
+
+
+def _score_classic(resume_text, jd_text):
+    from utils import calculate_match_score
+
+    return calculate_match_score(resume_text, jd_text)
+
+
+def _screen_classic(resumes, jd_text):
+    from utils import score_many
+
+    results = score_many([text for _, text in resumes], jd_text)
+    rows = [
+        {"candidate": candidate, "score": score, "matched": matched, "missing": missing,
+         "matched_count": len(matched), "missing_count": len(missing)}
+        for (candidate, _), (score, matched, missing) in zip(resumes, results)
+    ]
+    rows.sort(key=lambda r: r["score"], reverse=True)
+    for rank, row in enumerate(rows, 1):
+        row["rank"] = rank
+    return rows
+
+
+ENGINES = {
+    "semantic": (_score_semantic, _screen_semantic),
+    "classic": (_score_classic, _screen_classic),
+}
+
+
+def _parse_upload(filename, data):
+    from updated_utils import extract_text_from_pdf, extract_text_from_docx
+
+    name = filename.lower()
+    if name.endswith(".pdf"):
+        return extract_text_from_pdf(io.BytesIO(data))
+    if name.endswith(".docx"):
+        return extract_text_from_docx(io.BytesIO(data))
+    raise web.HTTPUnsupportedMediaType(text=f"Unsupported resume type: {filename}")
+
+
+# ---------------- ADMISSION ----------------
+class Admission:
+    # Counts every admitted request (reading, queued or scoring); only
+    # max_in_flight jobs hold a scoring slot at a time. A slot is held until
+    # its job has really finished: a timed-out request stops waiting, but its
+    # worker thread keeps scoring, and that abandoned work counts against
+    # admission until it ends.
+    def __init__(self, max_in_flight, max_queued):
+        self.slots = asyncio.Semaphore(max_in_flight)
+        self.max_in_flight = max_in_flight
+        self.limit = max_in_flight + max_queued
+        self.pending = 0
+        self.rejected = 0
+        self._abandoned = set()
+
+    @property
+    def abandoned(self):
+        return len(self._abandoned)
+
+    async def __aenter__(self):
+        if self.pending + self.abandoned >= self.limit or self.abandoned >= self.max_in_flight:
+            self.rejected += 1
+            raise web.HTTPTooManyRequests(text="Scoring queue is full, retry later", headers={"Retry-After": "1"})
+        self.pending += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        self.pending -= 1
+
+    async def run(self, executor, fn, *args):
+        loop = asyncio.get_running_loop()
+        await self.slots.acquire()
+        try:
+            job = executor.submit(fn, *args)
+        except BaseException:
+            self.slots.release()
+            raise
+        job.add_done_callback(lambda job: self._schedule_finished(loop, job))
+        try:
+            return await asyncio.wrap_future(job)
+        except asyncio.CancelledError:
+            if not job.done():
+                self._abandoned.add(job)
+            raise
+
+    def _schedule_finished(self, loop, job):
+        # Worker thread; a job that outlives the server has nothing to release
+        if not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._finished, job)
+            except RuntimeError:
+                # Closed between the check and the call
+                pass
+
+    def _finished(self, job):
+        self._abandoned.discard(job)
+        self.slots.release()
+
+
+# ---------------- REQUEST PARSING ----------------
+async def _read_part(part, max_bytes=MAX_UPLOAD_BYTES):
+    chunks, size = [], 0
+    while True:
+        chunk = await part.read_chunk(CHUNK_SIZE)
+        if not chunk:
+            return b"".join(chunks)
+        size += len(chunk)
+        if size > max_bytes:
+            raise web.HTTPRequestEntityTooLarge(max_size=max_bytes, actual_size=size)
+        chunks.append(chunk)
+
+
+async def _read_request(request):
+    # -> (jd_text, [(candidate, text | None, (filename, bytes) | None)])
+    if request.content_type == "application/json":
+        # Bodies over MAX_JSON_BYTES are refused with 413 by aiohttp
+        try:
+            body = await request.json()
+            jd_text = body.get("jd_text", "")
+            if "resumes" in body:
+                resumes = [(r.get("candidate", str(i)), r.get("text", ""), None) for i, r in enumerate(body["resumes"])]
+            else:
+                resumes = [("resume", body.get("resume_text", ""), None)]
+        except (json.JSONDecodeError, UnicodeDecodeError, AttributeError, TypeError):
+            raise web.HTTPBadRequest(text="Malformed JSON body")
+        if len(resumes) > MAX_BATCH_RESUMES:
+            raise web.HTTPRequestEntityTooLarge(max_size=MAX_BATCH_RESUMES, actual_size=len(resumes))
+        return jd_text, resumes
+
+    if not request.content_type.startswith("multipart/"):
+        raise web.HTTPUnsupportedMediaType(text="Expected multipart/form-data or application/json")
+
+    jd_text, resumes = "", []
+    reader = await request.multipart()
+    async for part in reader:
+        if part.name == "jd":
+            jd_text = (await _read_part(part)).decode("utf-8", errors="ignore")
+        elif part.name == "resume_text":
+            resumes.append(("resume", (await _read_part(part)).decode("utf-8", errors="ignore"), None))
+        elif part.name == "resume":
+            filename = part.filename or "resume"
+            resumes.append((filename, None, (filename, await _read_part(part))))
+        if len(resumes) > MAX_BATCH_RESUMES:
+            raise web.HTTPRequestEntityTooLarge(max_size=MAX_BATCH_RESUMES, actual_size=len(resumes))
+    return jd_text, resumes
+
+
+def _unparseable(filename, error):
+    return f"Could not parse {filename}: {type(error).__name__}: {error}"
+
+
+def _resolve(resumes):
+    # Runs in the worker pool: uploaded files become text here. A file that
+    # is too large, of an unsupported type or corrupt is skipped on its own
+    resolved, skipped = [], []
+    for candidate, text, upload in resumes:
+        if upload is not None:
+            try:
+                text = _parse_upload(*upload)
+            except DocumentTooLargeError as e:
+                skipped.append({"candidate": candidate, "error": str(e)})
+                continue
+            except web.HTTPUnsupportedMediaType as e:
+                skipped.append({"candidate": candidate, "error": e.text})
+                continue
+            except Exception as e:
+                skipped.append({"candidate": candidate, "error": _unparseable(upload[0], e)})
+                continue
+        resolved.append((candidate, text))
+    return resolved, skipped
+
+
+# ---------------- HANDLERS ----------------
+async def _run(request, fn, *args):
+    app = request.app
+    # The timeout covers waiting for a slot as well as parsing and scoring
+    try:
+        return await asyncio.wait_for(app["admission"].run(app["executor"], fn, *args), REQUEST_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise web.HTTPGatewayTimeout(text=f"Scoring exceeded {REQUEST_TIMEOUT:g}s")
+
+
+def _score_job(engine, resumes, jd_text):
+    with tracing.trace("api_score"):
+        _, text, upload = resumes[0]
+        if upload is not None:
+            try:
+                text = _parse_upload(*upload)
+            except DocumentTooLargeError as e:
+                raise web.HTTPBadRequest(text=str(e))
+            except web.HTTPException:
+                raise
+            except Exception as e:
+                raise web.HTTPUnprocessableEntity(text=_unparseable(upload[0], e))
+        return engine[0](text, jd_text)
+
+
+def _screen_job(engine, resumes, jd_text):
+    with tracing.trace("api_batch"):
+        resolved, skipped = _resolve(resumes)
+        return engine[1](resolved, jd_text) if resolved else [], skipped
+
+
+async def handle_score(request):
+    async with request.app["admission"]:
+        jd_text, resumes = await _read_request(request)
+        if not jd_text or len(resumes) != 1:
+            raise web.HTTPBadRequest(text="Expected one resume and a jd")
+
+        start = time.perf_counter()
+        score, matched, missing = await _run(request, _score_job, request.app["engine"], resumes, jd_text)
+        return web.json_response({
+            "score": score,
+            "matched": matched,
+            "missing": missing,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+        })
+
+
+async def handle_batch(request):
+    async with request.app["admission"]:
+        jd_text, resumes = await _read_request(request)
+        if not jd_text or not resumes:
+            raise web.HTTPBadRequest(text="Expected resumes and a jd")
+
+        start = time.perf_counter()
+        ranked, skipped = await _run(request, _screen_job, request.app["engine"], resumes, jd_text)
+        return web.json_response({
+            "results": ranked,
+            "skipped": skipped,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+        })
+
+
+async def handle_health(request):
+    app = request.app
+    required = []
+    if app["engine_name"] == "semantic":
+        required = ["nltk_data", "skill_matcher", "encoding_service" if models.MICRO_BATCHING else "sentence_transformer",
+                    "skill_vectors"]
+    ready = all(models.is_loaded(name) for name in required)
+    admission = app["admission"]
+    return web.json_response({
+        "status": "ready" if ready else "warming_up",
+        "engine": app["engine_name"],
+        "models": {name: models.is_loaded(name) for name in required},
+        "load_times": models.load_times(),
+        "pending": admission.pending,
+        "abandoned": admission.abandoned,
+        "rejected": admission.rejected,
+    }, status=200 if ready else 503)
+
+
+# ---------------- APP ----------------
+def create_app(engine="semantic", workers=None, max_in_flight=MAX_IN_FLIGHT, max_queued=MAX_QUEUED, warm_up=True):
+    app = web.Application(client_max_size=MAX_JSON_BYTES)
+    app["engine_name"] = engine
+    app["engine"] = ENGINES[engine]
+    app["executor"] = ThreadPoolExecutor(max_workers=workers or max_in_flight, thread_name_prefix="api-score")
+
+    async def on_startup(app):
+        app["admission"] = Admission(max_in_flight, max_queued)
+        if warm_up and engine == "semantic":
+            models.warm_up_async()
+
+    async def on_cleanup(app):
+        app["executor"].shutdown(wait=False)
+
+    app.on_startup.append(on_startup)
+    app.on_cleanup.append(on_cleanup)
+    app.router.add_post("/score", handle_score)
+    app.router.add_post("/score/batch", handle_batch)
+    app.router.add_get("/health", handle_health)
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the scoring engine over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="semantic",
+                        help="semantic: updated_utils (MiniLM); classic: utils (TF-IDF)")
+    parser.add_argument("--max-in-flight", type=int, default=MAX_IN_FLIGHT, help="requests scored concurrently")
+    parser.add_argument("--max-queued", type=int, default=MAX_QUEUED, help="requests waiting before 429s")
+    args = parser.parse_args(argv)
+
+    app = create_app(args.engine, max_in_flight=args.max_in_flight, max_queued=args.max_queued)
+    web.run_app(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,55 +1,40 @@
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
 import time
 import datetime
 import random
-import tempfile
 import os
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-import spacy
-import os
-import spacy
-nlp = spacy.load("en_core_web_sm")
-
-from updated_utils import (
-    extract_text_from_pdf,
-    extract_text_from_docx,
-    calculate_match_score,
-    clean_text
-)
+import sys
+from functools import partial
+
+# Heavy dependencies (plotly, reportlab, torch, spaCy, nltk via updated_utils)
+# are imported where they are first needed so the upload page renders fast.
+import models
+import tracing
 
 # ---------------- CONFIGURATION AUR DATA ----------------
 
+# Domain keywords live with the skill taxonomy (data/skills.json)
 TECH_STACK_DATA = {
     "Data Science": {
         "courses": [
             ("Advanced Machine Learning Specialization", "https://coursera.org"),
             ("Deep Learning with PyTorch", "https://udemy.com"),
             ("Data Engineering Nanodegree", "https://udacity.com")
-        ],
-        "keywords": ["machine learning", "python", "sql", "tensorflow", "pytorch", "nlp"]
+        ]
     },
     "Web Development": {
         "courses": [
             ("Full Stack React Masterclass", "https://udemy.com"),
             ("Node.js Backend Development", "https://frontendmasters.com"),
             ("System Design for Web Scalability", "https://educative.io")
-        ],
-        "keywords": ["react", "javascript", "node", "html", "css", "mongodb", "aws"]
+        ]
     },
     "DevOps & Cloud": {
         "courses": [
             ("Docker and Kubernetes: The Complete Guide", "https://udemy.com"),
             ("AWS Certified Solutions Architect", "https://acloudguru.com"),
             ("Terraform Infrastructure as Code", "https://hashicorp.com")
-        ],
-        "keywords": ["docker", "kubernetes", "aws", "jenkins", "terraform", "linux"]
+        ]
     }
 }
 
@@ -66,6 +51,17 @@ st.set_page_config(
     layout="wide"
 )
 
+# ---------------- MODELS ----------------
+
+@st.cache_resource
+def start_model_warmup():
+    # One background load per server process, shared by every session and
+    # rerun; the models are ready by the time the user clicks RUN ANALYSIS
+    return models.warm_up_async()
+
+if os.environ.get("SKILLSYNC_WARMUP", "1") != "0":
+    start_model_warmup()
+
 # ---------------- CUSTOM CSS (PREMIUM LIGHT THEME) ----------------
 
 st.markdown("""
@@ -222,40 +218,45 @@ textarea:focus {
 
 # ---------------- HELPER FUNCTIONS ----------------
 
-def generate_report_pdf(score, matched, missing, domain, health):
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        doc = SimpleDocTemplate(tmp.name, pagesize=A4)
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle('TitleStyle', parent=styles['Heading1'], alignment=1, fontSize=26, spaceAfter=30)
-        
-        content = []
-        content.append(Paragraph("SkillSync Pro Analysis Report", title_style))
-        content.append(Spacer(1, 0.3 * inch))
-        
-        data = [
-            ["Metric", "Value"],
-            ["Overall Match Score", f"{score}%"],
-            ["Predicted Domain", domain],
-            ["Structural Health", f"{health}/4"]
-        ]
-        t = Table(data, colWidths=[2.5 * inch, 2.5 * inch])
-        t.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#4f46e5")),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.lightgrey)
-        ]))
-        content.append(t)
-        content.append(Spacer(1, 0.5 * inch))
-        
-        content.append(Paragraph("Key Technical Assets Identified:", styles['Heading2']))
-        matched_items = [ListItem(Paragraph(s, styles['Normal'])) for s in matched]
-        content.append(ListFlowable(matched_items, bulletType='bullet'))
-        
-        doc.build(content)
-        return tmp.name
+def render_profiling_panel(last_n=20):
+    import pandas as pd
+
+    st.markdown("---")
+    st.markdown("## Engine Profiling")
+
+    traces = tracing.recent_traces(last_n)
+    if not traces:
+        st.info("No analyses traced yet in this server process.")
+        return
+
+    st.markdown(f"### Last {len(traces)} analyses (ms per stage)")
+    rows = []
+    for t in reversed(traces):
+        row = {"run": t["label"], "started": datetime.datetime.fromtimestamp(t["started"]).strftime("%H:%M:%S"), "total": round(t["total_ms"], 1)}
+        row.update({stage: round(ms, 1) for stage, ms in tracing.breakdown(t).items()})
+        rows.append(row)
+    st.dataframe(pd.DataFrame(rows).fillna(0), use_container_width=True, hide_index=True)
+
+    st.markdown("### Stage latency percentiles")
+    summary = pd.DataFrame.from_dict(tracing.summaries(), orient="index").round(2)
+    st.dataframe(summary, use_container_width=True)
+
+    engine = sys.modules.get("updated_utils")
+    if engine is not None:
+        st.markdown("### Embedding cache")
+        st.json(engine.embedding_cache_metrics())
+        st.markdown("### Document cache")
+        st.json(engine.document_cache_metrics())
+
+    d1, d2 = st.columns(2)
+    d1.download_button("EXPORT JSON", tracing.export_json(), file_name="skillsync_profile.json")
+    d2.download_button("EXPORT PROMETHEUS", tracing.export_prometheus(), file_name="skillsync_metrics.prom")
+
+def parse_resume(uploaded_file):
+    # -> (file digest, parsed document); re-uploads and reruns hit the cache
+    from updated_utils import parse_document
+
+    return parse_document(uploaded_file)
 
 # ---------------- MAIN UI ----------------
 
@@ -268,7 +269,11 @@ c1, c2 = st.columns([1, 1], gap="large")
 with c1:
         st.markdown("<div class='card'>", unsafe_allow_html=True)
         st.markdown("### Resume Upload")
-        uploaded_file = st.file_uploader("Upload PDF or DOCX", type=["pdf", "docx"], label_visibility="collapsed")
+        bulk_mode = st.toggle("Bulk screening (rank multiple resumes)")
+        if bulk_mode:
+            uploaded_files = st.file_uploader("Upload PDF or DOCX files", type=["pdf", "docx"], accept_multiple_files=True, label_visibility="collapsed")
+        else:
+            uploaded_file = st.file_uploader("Upload PDF or DOCX", type=["pdf", "docx"], label_visibility="collapsed")
         st.markdown("</div>", unsafe_allow_html=True)
         
 with c2:
@@ -279,29 +284,91 @@ with c2:
 
 st.markdown("<br>", unsafe_allow_html=True)
 run = st.button("RUN ANALYSIS")
-if run:
+if run and bulk_mode:
+    if uploaded_files and jd_text:
+        with st.spinner(f"Screening {len(uploaded_files)} resumes..."), tracing.trace("bulk_screening"):
+            from updated_utils import screen_many
+            from document_parser import DocumentTooLargeError
+            from resume_structure import analyze_structure
+
+            start = time.perf_counter()
+            # Candidates are ranked by upload index, so two files with the
+            # same name keep their own structure; names are restored after
+            names, resumes, skipped = [], [], []
+            for f in uploaded_files:
+                try:
+                    document = parse_resume(f)[1]
+                except DocumentTooLargeError:
+                    skipped.append(f.name)
+                    continue
+                resumes.append((len(names), document))
+                names.append(f.name)
+            # Cached documents go in whole, so nothing is cleaned or split twice
+            ranked = screen_many(resumes, jd_text)
+            elapsed = time.perf_counter() - start
+            structures = [analyze_structure(document["text"]) for _, document in resumes]
+            positions = ranked["candidate"].tolist()
+            ranked["candidate"] = [names[i] for i in positions]
+
+        if skipped:
+            st.warning(f"Skipped {len(skipped)} oversized upload(s): {', '.join(skipped)}")
+
+        st.markdown("<hr style='margin-top:40px; margin-bottom:40px; border:1px solid rgba(255,255,255,0.08);'>", unsafe_allow_html=True)
+
+        k1, k2, k3 = st.columns(3)
+        k1.metric("Resumes Screened", len(ranked))
+        k2.metric("Top Match", f"{ranked['score'].iloc[0]}%" if len(ranked) else "-")
+        k3.metric("Throughput", f"{len(ranked) / elapsed:.1f} resumes/sec")
+
+        st.markdown("## Ranked Shortlist")
+        table = ranked.assign(
+            matched=ranked["matched"].str.join(", "),
+            missing=ranked["missing"].str.join(", ")
+        )
+        st.dataframe(table, use_container_width=True, hide_index=True)
+        e1, e2 = st.columns(2)
+        e1.download_button("EXPORT RANKING (CSV)", table.to_csv(index=False), file_name="SkillSync_Ranking.csv")
+
+        # One PDF per shortlisted candidate, rendered in a worker pool on click
+        from report import shortlist_zip
+        jobs = [
+            {"candidate": row.candidate, "score": row.score, "matched": row.matched,
+             "missing": row.missing, "structure": structures[i]}
+            for i, row in zip(positions, ranked.itertuples())
+        ]
+        e2.download_button("EXPORT REPORTS (ZIP)", partial(shortlist_zip, jobs), file_name="SkillSync_Reports.zip",
+                           mime="application/zip", on_click="ignore")
+
+    else:
+        st.error("Action Required: Please upload resumes and a job description to start the engine.")
+
+elif run:
     if uploaded_file and jd_text:
-        with st.spinner("Extracting semantic markers..."):
-            if uploaded_file.name.endswith(".pdf"):
-                raw_text = extract_text_from_pdf(uploaded_file)
-            else:
-                raw_text = extract_text_from_docx(uploaded_file)
-            
-            score, matched, missing = calculate_match_score(raw_text, jd_text)
-            
-            predicted_domain = "General Technology"
-            for domain, d_data in TECH_STACK_DATA.items():
-                if any(kw in raw_text.lower() for kw in d_data["keywords"]):
-                    predicted_domain = domain
-                    break
-            
-            checks = {
-                "Professional Summary": "objective" in raw_text.lower() or "summary" in raw_text.lower(),
-                "Academic History": "education" in raw_text.lower(),
-                "Project Portfolio": "projects" in raw_text.lower(),
-                "Work Experience": "experience" in raw_text.lower()
-            }
-            health_score = sum(checks.values())
+        with st.spinner("Extracting semantic markers..."), tracing.trace("analysis"):
+            from analysis_session import AnalysisSession
+            from document_parser import DocumentTooLargeError
+
+            # The parsed and embedded resume survives reruns; editing only the
+            # JD re-analyzes just the changed JD sentences. Keyed by content, so
+            # a renamed copy reuses it and a changed file of the same size doesn't
+            try:
+                digest, document = parse_resume(uploaded_file)
+            except DocumentTooLargeError as e:
+                st.error(f"Upload rejected: {e}")
+                st.stop()
+            session = st.session_state.get("analysis_session")
+            if session is None or session.key != digest:
+                session = AnalysisSession(document["text"], key=digest, document=document)
+                st.session_state["analysis_session"] = session
+
+            score, matched, missing = session.score(jd_text)
+
+            # Sections and domain come from one pass over the resume, done
+            # once per upload
+            structure = session.structure
+            predicted_domain = structure["domain"]
+            checks = structure["checks"]
+            health_score = structure["health"]
         
         st.markdown("<hr style='margin-top:40px; margin-bottom:40px; border:1px solid rgba(255,255,255,0.08);'>", unsafe_allow_html=True)
         
@@ -311,8 +378,11 @@ if run:
         k2.metric("Structure", f"{health_score}/4")
         k3.metric("Predicted Domain", predicted_domain)
         k4.metric("Gaps Found", len(missing))
+        st.caption(f"Scored in {session.last_latency_ms:.0f} ms")
 
         # Charts Section
+        import plotly.graph_objects as go
+
         v1, v2 = st.columns([1.2, 1], gap="large")
         
         with v1:
@@ -385,9 +455,10 @@ if run:
                 st.markdown(f"<p style='color:{color}; font-weight:bold; font-size: 1.1rem;'>{item}: {label}</p>", unsafe_allow_html=True)
             
             st.markdown("<br>", unsafe_allow_html=True)
-            report_path = generate_report_pdf(score, matched, missing, predicted_domain, health_score)
-            with open(report_path, "rb") as f:
-                st.download_button("EXPORT PDF REPORT", f, file_name=f"SkillSync_Report.pdf")
+            # Rendered in memory, and only when the download is clicked
+            from report import render_report
+            st.download_button("EXPORT PDF REPORT", partial(render_report, score, matched, missing, structure),
+                               file_name="SkillSync_Report.pdf", mime="application/pdf", on_click="ignore")
             st.markdown("</div>", unsafe_allow_html=True)
 
         with r2:
@@ -404,6 +475,10 @@ if run:
     else:
         st.error("Action Required: Please upload a resume and job description to start the engine.")
 
+# Admin: per-stage latency breakdown (enable with SKILLSYNC_ADMIN=1)
+if os.environ.get("SKILLSYNC_ADMIN") == "1" and st.sidebar.checkbox("Show profiling panel"):
+    render_profiling_panel()
+
 # Footer
 st.markdown("<div class='footer'>Made with ♡</div>", unsafe_allow_html=True)
 
@@ -0,0 +1,72 @@
+# Candidate retrieval over synthetic embeddings: brute force vs IVF
+#
+# Vectors are drawn around random topic centres so the data has the kind of
+# cluster structure real resume embeddings have. Reports recall@k against
+# brute force and per-query latency for several nprobe values.
+#
+#   python benchmarks/bench_candidate_index.py [--candidates 100000] [--k 50]
+
+import argparse
+import time
+
+import numpy as np
+
+from common import ROOT  # noqa: F401  (puts the repo root on sys.path)
+
+from candidate_index import CandidateIndex
+
+
+def synthetic(n, dim, topics=200, seed=0):
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((topics, dim)).astype(np.float32)
+    labels = rng.integers(0, topics, size=n)
+    return centres[labels] + 0.6 * rng.standard_normal((n, dim)).astype(np.float32), centres
+
+
+def timed_queries(index, queries, k, nprobe):
+    results, start = [], time.perf_counter()
+    for q in queries:
+        results.append(set(index.search_vector(q, k=k, nprobe=nprobe)[0]))
+    return results, (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candidates", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=50)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    args = parser.parse_args()
+
+    vectors, centres = synthetic(args.candidates, args.dim)
+    index = CandidateIndex(args.dim)
+
+    start = time.perf_counter()
+    empty = np.zeros((0, args.dim), dtype=np.float32)
+    for i, v in enumerate(vectors):
+        index.add(i, "", empty, v)
+    print(f"added {len(index)} candidates in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    index.build_ivf()
+    print(f"built IVF with {len(index.centroids)} lists in {time.perf_counter() - start:.1f}s")
+
+    rng = np.random.default_rng(1)
+    queries = centres[rng.integers(0, len(centres), size=args.queries)] + 0.6 * rng.standard_normal((args.queries, args.dim))
+
+    exact, brute_ms = timed_queries(index, queries, args.k, None)
+    print(f"{'brute force':<14} {brute_ms:8.2f} ms/query   recall@{args.k} 1.000")
+    for nprobe in args.nprobe:
+        approx, ms = timed_queries(index, queries, args.k, nprobe)
+        recall = np.mean([len(a & e) / len(e) for a, e in zip(approx, exact)])
+        print(f"{'ivf nprobe=' + str(nprobe):<14} {ms:8.2f} ms/query   recall@{args.k} {recall:.3f}")
+
+    start = time.perf_counter()
+    for i in range(0, args.candidates, 10):
+        index.delete(i)
+    print(f"deleted {args.candidates // 10} candidates in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# Re-uploads: extract + clean + split on every rerun vs DocumentCache lookups
+# by file digest (memory, and disk as seen by a fresh process)
+#
+#   python benchmarks/bench_document_cache.py [--pages 1 10 50]
+
+import io
+import argparse
+import tempfile
+
+from common import time_call, summarize, print_row
+from corpus import resume_pdf, resume_docx
+
+from document_cache import DocumentCache
+from updated_utils import extract_text_from_pdf, extract_text_from_docx, clean_text, split_sentences
+
+
+def parse(data, name):
+    extract = extract_text_from_pdf if name.endswith(".pdf") else extract_text_from_docx
+    text = extract(io.BytesIO(data))
+    clean = clean_text(text)
+    return {"text": text, "clean": clean, "sentences": split_sentences(clean)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for pages in args.pages:
+        for name, data in (("resume.pdf", resume_pdf(pages)), ("resume.docx", resume_docx(pages))):
+            with tempfile.TemporaryDirectory() as directory:
+                cache = DocumentCache(directory)
+                _, expected = cache.get_or_parse(data, lambda d: parse(d, name))
+
+                cold = summarize(time_call(lambda: parse(data, name), args.repeat))
+                memory = summarize(time_call(lambda: cache.get_or_parse(data, lambda d: parse(d, name)), args.repeat))
+
+                def from_disk():
+                    # New process: empty memory layer, documents on disk
+                    cache.clear_memory()
+                    return cache.get_or_parse(data, lambda d: parse(d, name))
+
+                disk = summarize(time_call(from_disk, args.repeat))
+                assert from_disk()[1] == expected
+
+            print(f"--- {name}, {pages} pages, {len(data) / 1024:.0f} KiB ---")
+            print_row("parse every rerun", cold)
+            print_row("cache, memory hit", memory, f"(x{cold['median_ms'] / memory['median_ms']:.0f})")
+            print_row("cache, disk hit", disk, f"(x{cold['median_ms'] / disk['median_ms']:.0f})")
+            print(f"stats: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Full-document embedding: encoding the whole resume as one extra input
+# (truncated at the encoder's window) vs pooling the sentence embeddings that
+# scoring computes anyway. Reports cost and document coverage per length.
+#
+#   python benchmarks/bench_document_embedding.py [--pages 1 2 5 10 30]
+
+import io
+import argparse
+
+from common import time_call, summarize
+from corpus import resume_pdf
+
+from document_parser import extract_pdf_text
+from models import get_sentence_model
+from updated_utils import clean_text, split_sentences, document_embedding
+
+
+def token_count(model, text):
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is None:
+        return len(text.split())
+    return len(tokenizer(text, add_special_tokens=False)["input_ids"])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 5, 10, 30])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # The model itself, so the embedding cache does not hide the forward passes
+    model = get_sentence_model()
+    window = getattr(model, "max_seq_length", 256)
+
+    print(f"{'pages':>5} {'words':>7} {'sentences':>9}  {'whole doc + sentences':>22}  {'pooled sentences':>17}  coverage")
+    for pages in args.pages:
+        text = clean_text(extract_pdf_text(io.BytesIO(resume_pdf(pages, seed=pages)), workers=1))
+        sentences = split_sentences(text)
+        words = len(text.split())
+
+        before = summarize(time_call(lambda: model.encode(sentences + [text], convert_to_numpy=True), args.repeat))
+        after = summarize(time_call(
+            lambda: document_embedding(sentences, model.encode(sentences, convert_to_numpy=True)), args.repeat))
+
+        coverage = min(1.0, window / max(token_count(model, text), 1))
+        print(f"{pages:>5} {words:>7} {len(sentences):>9}  "
+              f"{before['median_ms']:>10.1f} ms ({before['median_ms'] * 1000 / words:5.1f}/kw)  "
+              f"{after['median_ms']:>8.1f} ms ({after['median_ms'] * 1000 / words:5.1f}/kw)  "
+              f"{coverage:6.1%} -> 100%")
+
+
+if __name__ == "__main__":
+    main()
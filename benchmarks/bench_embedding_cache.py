@@ -0,0 +1,50 @@
+# Embedding cache: one resume scored against many requisitions, cold vs warm
+#
+#   python benchmarks/bench_embedding_cache.py [--jds 20]
+
+import argparse
+import tempfile
+import time
+
+from common import ROOT  # noqa: F401  (puts the repo root on sys.path)
+
+import updated_utils
+from embedding_cache import EmbeddingCache
+from bench_screen_many import JD, SKILLS, synthetic_resume
+
+import random
+
+
+def run(resume, jds):
+    start = time.perf_counter()
+    for jd in jds:
+        updated_utils.calculate_match_score(resume, jd)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jds", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    resume = synthetic_resume(rng, sentences=40)
+    jds = [JD + f" Requisition {i} also values {rng.choice(SKILLS)}." for i in range(args.jds)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        updated_utils.embedding_cache = EmbeddingCache(updated_utils.ENCODER_KEY, directory=directory)
+        cold = run(resume, jds)
+        warm = run(resume, jds)
+        print(f"cold pass  {cold * 1000:9.1f} ms  ({cold * 1000 / args.jds:.1f} ms/JD)")
+        print(f"warm pass  {warm * 1000:9.1f} ms  ({warm * 1000 / args.jds:.1f} ms/JD)")
+        print("metrics   ", updated_utils.embedding_cache_metrics())
+
+        # New process view: disk layer only
+        updated_utils.embedding_cache = EmbeddingCache(updated_utils.ENCODER_KEY, directory=directory)
+        reopened = run(resume, jds)
+        print(f"disk pass  {reopened * 1000:9.1f} ms  ({reopened * 1000 / args.jds:.1f} ms/JD)")
+        print("metrics   ", updated_utils.embedding_cache_metrics())
+
+
+if __name__ == "__main__":
+    main()
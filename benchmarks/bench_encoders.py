@@ -0,0 +1,99 @@
+# Encoder backends: load time, sentences/sec, peak RSS, and agreement with
+# the default torch backend (cosine similarities and final match scores).
+#
+#   python benchmarks/bench_encoders.py --backends torch int8 onnx --onnx-dir ./minilm-onnx
+#
+# Each backend is measured in a fresh interpreter so RSS is not shared.
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from common import ROOT
+
+CHILD = """
+import json, resource, sys, time
+sys.path[:0] = [{root!r}, {bench!r}]
+import numpy as np
+from encoders import load_encoder
+from models import MODEL_NAME
+import corpus
+
+start = time.perf_counter()
+encoder = load_encoder({backend!r}, MODEL_NAME, {onnx_dir!r})
+load_s = time.perf_counter() - start
+
+sentences = corpus.resume_text(10, seed=1).splitlines()
+encoder.encode(sentences[:32])
+start = time.perf_counter()
+vectors = encoder.encode(sentences, batch_size=64)
+encode_s = time.perf_counter() - start
+
+np.save({out!r}, vectors)
+print(json.dumps({{
+    "load_s": load_s,
+    "sentences_per_sec": len(sentences) / encode_s,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}}))
+"""
+
+
+def score_drift(backend, onnx_dir):
+    # Final match scores through updated_utils with each backend, same inputs
+    import corpus
+    import models
+    import updated_utils
+    from embedding_cache import EmbeddingCache
+    from encoders import load_encoder
+
+    pairs = [(corpus.resume_text(p, seed=p), corpus.job_description(s, seed=s)) for p in (1, 3) for s in (5, 15, 40)]
+    scores = {}
+    for name in ("torch", backend):
+        models._registry["sentence_transformer"] = load_encoder(name, models.MODEL_NAME, onnx_dir)
+        updated_utils.embedding_cache = EmbeddingCache(name, directory=None, max_items=0)
+        scores[name] = [updated_utils.calculate_match_score(r, j)[0] for r, j in pairs]
+    return max(abs(a - b) for a, b in zip(scores["torch"], scores[backend]))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=["torch", "int8"])
+    parser.add_argument("--onnx-dir", default=os.environ.get("SKILLSYNC_ONNX_DIR"))
+    args = parser.parse_args()
+
+    bench_dir = os.path.dirname(os.path.abspath(__file__))
+    vectors = {}
+    for backend in args.backends:
+        out = os.path.join(bench_dir, f".vectors_{backend}.npy")
+        code = CHILD.format(root=ROOT, bench=bench_dir, backend=backend, onnx_dir=args.onnx_dir, out=out)
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        if proc.returncode:
+            print(f"{backend:<6} failed: {proc.stderr.strip().splitlines()[-1]}")
+            continue
+        stats = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(f"{backend:<6} load {stats['load_s']:6.2f} s   {stats['sentences_per_sec']:8.1f} sentences/s   "
+              f"peak RSS {stats['peak_rss_mb']:7.1f} MB")
+
+        import numpy as np
+        vectors[backend] = np.load(out)
+        os.remove(out)
+
+    from encoders import SIMILARITY_TOLERANCE, SCORE_TOLERANCE
+
+    reference = vectors.get("torch")
+    for backend, v in vectors.items():
+        if backend == "torch" or reference is None:
+            continue
+        sim_ref = reference @ reference.T
+        sim = v @ v.T
+        cos_drift = float(abs(sim - sim_ref).max())
+        points = score_drift(backend, args.onnx_dir)
+        ok = cos_drift <= SIMILARITY_TOLERANCE and points <= SCORE_TOLERANCE
+        print(f"{backend:<6} max cosine drift {cos_drift:.4f} (tol {SIMILARITY_TOLERANCE}), "
+              f"max score drift {points} pts (tol {SCORE_TOLERANCE}): {'OK' if ok else 'OUT OF TOLERANCE'}")
+
+
+if __name__ == "__main__":
+    main()
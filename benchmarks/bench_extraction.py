@@ -0,0 +1,59 @@
+# PDF extraction on synthetic 1-, 10- and 300-page documents: the old
+# read-everything + `text += page` loop vs the page generator (sequential
+# and page-parallel)
+#
+#   python benchmarks/bench_extraction.py [--pages 1 10 300]
+
+import argparse
+import io
+
+import fitz
+
+from common import time_call, summarize, print_row
+
+import document_parser
+
+LINE = "Senior engineer delivering python, sql and docker based services for analytics teams."
+
+
+def synthetic_pdf(pages, lines_per_page=45):
+    doc = fitz.open()
+    for p in range(pages):
+        page = doc.new_page()
+        text = "\n".join(f"{p}.{i} {LINE}" for i in range(lines_per_page))
+        page.insert_textbox(fitz.Rect(36, 36, 576, 806), text, fontsize=8)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def legacy_extract(file):
+    text = ""
+    file.seek(0)
+    with fitz.open(stream=file.read(), filetype="pdf") as doc:
+        for page in doc:
+            text += page.get_text()
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 300])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for pages in args.pages:
+        file = io.BytesIO(synthetic_pdf(pages))
+        print(f"--- {pages} pages, {len(file.getvalue()) / 1024:.0f} KB ---")
+
+        print_row("legacy concatenation", summarize(time_call(lambda: legacy_extract(file), args.repeat)))
+        print_row("generator, no limits", summarize(time_call(
+            lambda: document_parser.extract_pdf_text(file, max_pages=pages, workers=1), args.repeat)))
+        print_row("page-parallel, no limits", summarize(time_call(
+            lambda: document_parser.extract_pdf_text(file, max_pages=pages), args.repeat)))
+        print_row(f"default limit ({document_parser.MAX_PDF_PAGES} pages)", summarize(time_call(
+            lambda: document_parser.extract_pdf_text(file), args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Cold-boot import cost, parsed from `python -X importtime`
+#
+# Prints the cumulative import time of each target plus the heaviest
+# top-level packages it pulls in. Use --json to append a machine-readable
+# record to a tracking file.
+#
+#   python benchmarks/bench_import_time.py [--targets app updated_utils] [--json out.jsonl]
+
+import argparse
+import datetime
+import json
+import os
+import subprocess
+import sys
+
+from common import ROOT
+
+
+def import_profile(target):
+    env = dict(os.environ, SKILLSYNC_WARMUP="0", PYTHONPATH=ROOT)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, cwd=ROOT, env=env,
+    )
+
+    packages = {}
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        if name.startswith("  "):
+            continue
+        # Top-level imports: their cumulative times add up to the total
+        packages[name.strip()] = int(cumulative_us)
+        total_us += int(cumulative_us)
+    return total_us, packages, proc.returncode
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--targets", nargs="+", default=["app", "updated_utils", "models"])
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--json", help="append results to this JSON-lines file")
+    args = parser.parse_args()
+
+    records = []
+    for target in args.targets:
+        total_us, packages, code = import_profile(target)
+        heaviest = sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:args.top]
+
+        status = "" if code == 0 else f"  (exit {code})"
+        print(f"--- import {target}: {total_us / 1000:.1f} ms{status} ---")
+        for name, us in heaviest:
+            print(f"    {name:<40} {us / 1000:9.1f} ms")
+
+        records.append({
+            "target": target,
+            "total_ms": total_us / 1000,
+            "heaviest": {name: us / 1000 for name, us in heaviest},
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        })
+
+    if args.json:
+        with open(args.json, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
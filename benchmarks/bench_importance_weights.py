@@ -0,0 +1,61 @@
+# Importance weighting in utils.calculate_match_score: per skill x keyword
+# proximity regexes vs the sorted-offset window join
+#
+#   python benchmarks/bench_importance_weights.py [--jd-sentences 10 50 200]
+
+import argparse
+import random
+import re
+
+from common import time_call, summarize, print_row
+
+from utils import IMPORTANCE_LEVELS, clean_text, extract_dynamic_skills, importance_weights, normalize_aliases
+
+TEMPLATES = [
+    "Candidates must have hands-on experience with {a} and {b}.",
+    "Knowledge of {a} is mandatory for this role.",
+    "{a} and {b} are preferred.",
+    "You should have exposure to {a} in production.",
+    "Familiarity with {a} or {b} is nice to have.",
+    "The team works daily with {a}, {b} and modern tooling.",
+]
+SKILLS = ["python", "sql", "docker", "kubernetes", "react", "tensorflow", "spark", "airflow", "terraform", "linux"]
+
+
+def legacy_weights(skills, jd_processed):
+    weights = {}
+    for skill in skills:
+        weight = 2
+        for level, keywords in IMPORTANCE_LEVELS.items():
+            for keyword in keywords:
+                pattern = rf"{keyword}(.{{0,40}}){re.escape(skill)}|{re.escape(skill)}(.{{0,40}}){keyword}"
+                if re.search(pattern, jd_processed):
+                    weight = level
+        weights[skill] = weight
+    return weights
+
+
+def synthetic_jd(sentences, seed=2):
+    rng = random.Random(seed)
+    lines = [rng.choice(TEMPLATES).format(a=rng.choice(SKILLS), b=rng.choice(SKILLS)) for _ in range(sentences)]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jd-sentences", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for n in args.jd_sentences:
+        jd = normalize_aliases(clean_text(synthetic_jd(n)))
+        skills = extract_dynamic_skills(jd)
+        identical = legacy_weights(skills, jd) == importance_weights(skills, jd)
+
+        print(f"--- {n} sentences, {len(jd)} chars, {len(skills)} skills (identical: {identical}) ---")
+        print_row("proximity regex loop", summarize(time_call(lambda: legacy_weights(skills, jd), args.repeat)))
+        print_row("offset window join", summarize(time_call(lambda: importance_weights(skills, jd), args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
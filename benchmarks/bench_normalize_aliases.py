@@ -0,0 +1,66 @@
+# Alias normalization: per-alias re.sub loop vs the single-pass trie regex
+#
+#   python benchmarks/bench_normalize_aliases.py [--aliases 0 1000 5000] [--resume-kb 10 100]
+
+import argparse
+import random
+import re
+import string
+
+from common import time_call, summarize, print_row
+
+from utils import SKILL_ALIASES, build_alias_normalizer
+
+
+def legacy_normalize(text, aliases):
+    for standard_name, alias_list in aliases.items():
+        for alias in alias_list:
+            pattern = rf'\b{re.escape(alias)}\b'
+            text = re.sub(pattern, standard_name, text, flags=re.IGNORECASE)
+    return text
+
+
+def synthetic_aliases(n, seed=5):
+    rng = random.Random(seed)
+    table = dict(SKILL_ALIASES)
+    while sum(len(v) for v in table.values()) < n:
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10)))
+        table[f"skill {word}"] = [f"{word}x", f"{word} tool"]
+    return table
+
+
+def synthetic_resume(kb, aliases, seed=9):
+    rng = random.Random(seed)
+    vocab = [a for alias_list in aliases.values() for a in alias_list]
+    filler = ["built", "scalable", "services", "with", "team", "delivered", "platform", "using", "and"]
+    words, size = [], 0
+    while size < kb * 1024:
+        word = rng.choice(vocab) if rng.random() < 0.05 else rng.choice(filler)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--aliases", type=int, nargs="+", default=[0, 1000, 5000])
+    parser.add_argument("--resume-kb", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for n in args.aliases:
+        table = synthetic_aliases(n) if n else SKILL_ALIASES
+        normalize = build_alias_normalizer(table)
+        total = sum(len(v) for v in table.values())
+
+        for kb in args.resume_kb:
+            text = synthetic_resume(kb, table)
+            print(f"--- {total} aliases, {kb} KB resume ---")
+            before = summarize(time_call(lambda: legacy_normalize(text, table), args.repeat))
+            after = summarize(time_call(lambda: normalize(text), args.repeat))
+            print_row("per-alias re.sub", before)
+            print_row("single-pass trie", after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# PDF reports: the old NamedTemporaryFile + per-call stylesheet path vs
+# in-memory rendering with cached styles, and shortlist zips serial vs pooled
+#
+#   python benchmarks/bench_report.py [--shortlist 50]
+
+import os
+import argparse
+import tempfile
+import time
+
+from common import time_call, summarize, print_row
+
+import report
+
+SKILLS = ["python", "sql", "docker", "kubernetes", "aws", "react", "machine learning", "pandas"]
+STRUCTURE = {
+    "domain": "Data Science",
+    "health": 3,
+    "checks": {"Professional Summary": True, "Academic History": True,
+               "Project Portfolio": False, "Work Experience": True},
+}
+
+
+def tempfile_report(score, matched, missing, domain, health):
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
+        doc = SimpleDocTemplate(tmp.name, pagesize=A4)
+        styles = getSampleStyleSheet()
+        title_style = ParagraphStyle('TitleStyle', parent=styles['Heading1'], alignment=1, fontSize=26, spaceAfter=30)
+        content = [Paragraph("SkillSync Pro Analysis Report", title_style), Spacer(1, 0.3 * inch)]
+        t = Table([["Metric", "Value"], ["Overall Match Score", f"{score}%"], ["Predicted Domain", domain],
+                   ["Structural Health", f"{health}/4"]], colWidths=[2.5 * inch, 2.5 * inch])
+        t.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#4f46e5")),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.lightgrey)
+        ]))
+        content += [t, Spacer(1, 0.5 * inch), Paragraph("Key Technical Assets Identified:", styles['Heading2'])]
+        content.append(ListFlowable([ListItem(Paragraph(s, styles['Normal'])) for s in matched], bulletType='bullet'))
+        doc.build(content)
+        return tmp.name
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--shortlist", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=max(2, report.REPORT_WORKERS))
+    args = parser.parse_args()
+
+    paths = []
+    before = summarize(time_call(lambda: paths.append(tempfile_report(80, SKILLS, [], "Data Science", 3)), args.repeat))
+    leaked = sum(os.path.getsize(p) for p in paths)
+    for p in paths:
+        os.remove(p)
+    after = summarize(time_call(lambda: report.render_report(80, SKILLS, [], STRUCTURE), args.repeat))
+    print_row("tempfile + fresh styles", before, f"  {len(paths)} files / {leaked / 1024:.0f} KiB left behind")
+    print_row("in-memory + cached styles", after)
+
+    jobs = [{"candidate": f"candidate_{i}.pdf", "score": 90 - i % 50, "matched": SKILLS[:i % 8 + 1],
+             "missing": SKILLS[i % 8 + 1:], "structure": STRUCTURE} for i in range(args.shortlist)]
+    for workers in sorted({1, args.workers}):
+        report.shortlist_zip(jobs[:report.PARALLEL_REPORT_THRESHOLD], workers)
+        start = time.perf_counter()
+        data = report.shortlist_zip(jobs, workers)
+        elapsed = time.perf_counter() - start
+        print(f"{'zip, ' + str(workers) + ' worker(s)':<32} {elapsed * 1000:9.1f} ms  "
+              f"({args.shortlist / elapsed:.0f} reports/sec, {len(data) / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
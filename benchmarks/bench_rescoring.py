@@ -0,0 +1,49 @@
+# Re-scoring latency after small JD edits: full calculate_match_score vs an
+# AnalysisSession that keeps the resume and reuses unchanged JD sentences
+#
+#   python benchmarks/bench_rescoring.py [--edits 6]
+
+import argparse
+import random
+import time
+
+from common import ROOT  # noqa: F401  (puts the repo root on sys.path)
+
+from analysis_session import AnalysisSession
+from bench_screen_many import JD, synthetic_resume
+from updated_utils import calculate_match_score
+
+EDITS = [
+    " Experience with jenkins is a plus.",
+    " Strong git skills are required.",
+    " Knowledge of pandas and numpy is preferred.",
+    " Excel reporting is nice to have.",
+    " Mongodb is essential.",
+    " Tailwind or bootstrap is a plus.",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--edits", type=int, default=len(EDITS))
+    args = parser.parse_args()
+
+    resume = synthetic_resume(random.Random(8), sentences=60)
+    session = AnalysisSession(resume)
+    session.score(JD)
+
+    jd = JD
+    for i in range(args.edits):
+        jd += EDITS[i % len(EDITS)]
+
+        start = time.perf_counter()
+        full = calculate_match_score(resume, jd)
+        full_ms = (time.perf_counter() - start) * 1000
+
+        incremental = session.score(jd)
+        same = "same" if incremental == full else "DIFFERENT"
+        print(f"edit {i + 1}: full {full_ms:7.1f} ms   incremental {session.last_latency_ms:7.1f} ms   ({same} result)")
+
+
+if __name__ == "__main__":
+    main()
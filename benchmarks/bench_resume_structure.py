@@ -0,0 +1,55 @@
+# Section checks and domain prediction: app.py's repeated lowercase +
+# substring scans vs resume_structure's single tokenization pass
+#
+#   python benchmarks/bench_resume_structure.py [--pages 2 10 30]
+
+import io
+import argparse
+
+from common import time_call, summarize, print_row
+from corpus import resume_pdf
+
+from document_parser import extract_pdf_text
+from models import get_skill_taxonomy
+from resume_structure import analyze_structure
+
+
+def substring_structure(raw_text, domain_keywords):
+    predicted_domain = "General Technology"
+    for domain, keywords in domain_keywords.items():
+        if any(kw in raw_text.lower() for kw in keywords):
+            predicted_domain = domain
+            break
+
+    checks = {
+        "Professional Summary": "objective" in raw_text.lower() or "summary" in raw_text.lower(),
+        "Academic History": "education" in raw_text.lower(),
+        "Project Portfolio": "projects" in raw_text.lower(),
+        "Work Experience": "experience" in raw_text.lower()
+    }
+    return predicted_domain, checks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[2, 10, 30])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    domain_keywords = get_skill_taxonomy().domain_keywords
+    analyze_structure("warm up")
+
+    for pages in args.pages:
+        text = extract_pdf_text(io.BytesIO(resume_pdf(pages, seed=pages)), workers=1)
+        before = summarize(time_call(lambda: substring_structure(text, domain_keywords), args.repeat))
+        after = summarize(time_call(lambda: analyze_structure(text), args.repeat))
+
+        old_domain, old_checks = substring_structure(text, domain_keywords)
+        result = analyze_structure(text)
+        print(f"--- {pages} pages, {len(text)} chars ---")
+        print_row("substring scans", before, f"  domain {old_domain!r} checks {sum(old_checks.values())}/4")
+        print_row("single pass", after, f"  domain {result['domain']!r} checks {result['health']}/4")
+
+
+if __name__ == "__main__":
+    main()
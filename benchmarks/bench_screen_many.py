@@ -0,0 +1,59 @@
+# Bulk screening throughput: per-file calculate_match_score loop vs screen_many
+#
+#   python benchmarks/bench_screen_many.py [--resumes 50 200] [--batch-sizes 8 32 128]
+
+import argparse
+import random
+import time
+
+from common import ROOT  # noqa: F401  (puts the repo root on sys.path)
+
+from updated_utils import calculate_match_score, screen_many
+
+SKILLS = [
+    "python", "java", "sql", "machine learning", "docker", "kubernetes", "aws", "react", "css",
+    "pandas", "numpy", "tensorflow", "git", "leadership", "communication", "excel", "seo",
+]
+
+JD = (
+    "We are looking for professionals who are efficient with c++, machine learning, sql and python. "
+    "Docker is a mandatory skill. Strong communication and leadership are required. "
+    "Experience with aws and kubernetes is preferred. React or css is a plus."
+)
+
+
+def synthetic_resume(rng, sentences=25):
+    lines = []
+    for _ in range(sentences):
+        picked = rng.sample(SKILLS, 3)
+        lines.append(f"Built and maintained production systems using {picked[0]}, {picked[1]} and {picked[2]}.")
+    return " ".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for n in args.resumes:
+        resumes = [(f"candidate_{i}.pdf", synthetic_resume(rng)) for i in range(n)]
+        print(f"--- {n} resumes ---")
+
+        start = time.perf_counter()
+        for _, text in resumes:
+            calculate_match_score(text, JD)
+        elapsed = time.perf_counter() - start
+        print(f"{'per-file loop':<24} {n / elapsed:8.1f} resumes/sec")
+
+        for batch_size in args.batch_sizes:
+            start = time.perf_counter()
+            screen_many(resumes, JD, batch_size=batch_size)
+            elapsed = time.perf_counter() - start
+            print(f"{'screen_many bs=' + str(batch_size):<24} {n / elapsed:8.1f} resumes/sec")
+
+
+if __name__ == "__main__":
+    main()
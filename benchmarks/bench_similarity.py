@@ -0,0 +1,78 @@
+# Per-skill max similarity: full util.cos_sim matrix vs similarity.max_cosine
+# streaming sentence blocks through a fixed buffer. Asserts both agree, then
+# reports time and peak memory as resumes grow.
+#
+#   python benchmarks/bench_similarity.py [--sentences 100 1000 10000 100000]
+
+import argparse
+import tracemalloc
+
+from common import time_call, summarize, print_row
+
+import numpy as np
+import torch
+from sentence_transformers import util
+
+from similarity import max_cosine, DEFAULT_BLOCK_SIZE
+
+TOLERANCE = {np.float32: 1e-5, np.float16: 5e-3}
+
+
+def full_matrix(queries, keys):
+    return util.cos_sim(queries, keys).max(dim=1).values.numpy()
+
+
+def peak_mib(fn):
+    # numpy allocations only; the full path is measured through its numpy
+    # equivalent (normalized copy of every sentence + the whole matrix)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def numpy_full_matrix(queries, keys):
+    q = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    k = keys / np.linalg.norm(keys, axis=1, keepdims=True)
+    return (q @ k.T).max(axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sentences", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--phrases", type=int, default=40)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    torch.set_grad_enabled(False)
+    rng = np.random.default_rng(0)
+    queries = rng.standard_normal((args.phrases, args.dim)).astype(np.float32)
+
+    for n in args.sentences:
+        keys = rng.standard_normal((n, args.dim)).astype(np.float32)
+        # Near-duplicates so some maxima are high, like real skill matches
+        keys[rng.integers(0, n, args.phrases // 2)] = queries[:args.phrases // 2] + 0.1
+
+        expected = full_matrix(queries, keys)
+        for dtype in (np.float32, np.float16):
+            got = max_cosine(queries, keys, args.block_size, dtype)
+            diff = np.abs(got - expected).max()
+            assert diff < TOLERANCE[dtype], f"{dtype.__name__} differs by {diff} at {n} sentences"
+
+        before = summarize(time_call(lambda: full_matrix(queries, keys), args.repeat))
+        after = summarize(time_call(lambda: max_cosine(queries, keys, args.block_size), args.repeat))
+        before_mem = peak_mib(lambda: numpy_full_matrix(queries, keys))
+        after_mem = peak_mib(lambda: max_cosine(queries, keys, args.block_size))
+        half_mem = peak_mib(lambda: max_cosine(queries, keys, args.block_size, np.float16))
+
+        print(f"--- {n} sentences x {args.phrases} phrases (results agree) ---")
+        print_row("full cos_sim matrix", before, f"  peak {before_mem:8.2f} MiB")
+        print_row(f"blocks of {args.block_size}, float32", after, f"  peak {after_mem:8.2f} MiB")
+        print(f"{'blocks, float16 buffer':<32} {'':>40}  peak {half_mem:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Per-skill vs batched phrase encoding inside updated_utils.calculate_match_score
+#
+#   python benchmarks/bench_skill_encoding.py [--skills 5 15 30 60]
+
+import argparse
+
+from common import time_call, summarize, print_row
+
+from sentence_transformers import util
+
+from models import get_sentence_model
+from updated_utils import split_sentences, clean_text
+
+RESUME = (
+    "Senior software engineer with 6 years of experience building data platforms in python and sql. "
+    "Designed machine learning pipelines with pandas, numpy and scikit-learn. "
+    "Deployed services with docker and kubernetes on aws. "
+    "Led a team of five engineers and owned project management for quarterly releases. "
+) * 4
+
+VOCAB = [
+    "python", "java", "c++", "javascript", "typescript", "go", "ruby", "php", "swift", "kotlin",
+    "rust", "nodejs", "express", "machine learning", "deep learning", "data analysis", "data science",
+    "sql", "mysql", "postgresql", "mongodb", "pandas", "numpy", "tensorflow", "pytorch", "scikit-learn",
+    "docker", "kubernetes", "aws", "azure", "gcp", "devops", "git", "jenkins", "react", "angular",
+    "vue", "html", "css", "bootstrap", "tailwind", "project management", "leadership", "communication",
+    "teamwork", "financial analysis", "accounting", "excel", "powerpoint", "seo", "digital marketing",
+    "content marketing", "branding", "google analytics", "recruitment", "talent acquisition",
+    "employee engagement",
+]
+
+
+def per_skill(model, phrases, resume_embeddings):
+    sims = []
+    for phrase in phrases:
+        phrase_embedding = model.encode(phrase)
+        sims.append(util.cos_sim(phrase_embedding, resume_embeddings)[0].max().item())
+    return sims
+
+
+def batched(model, phrases, resume_embeddings):
+    phrase_embeddings = model.encode(phrases)
+    return util.cos_sim(phrase_embeddings, resume_embeddings).max(dim=1).values.tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skills", type=int, nargs="+", default=[5, 15, 30, 57])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    model = get_sentence_model()
+    sentences = split_sentences(clean_text(RESUME))
+    resume_embeddings = model.encode(sentences)
+
+    for n in args.skills:
+        phrases = VOCAB[:n]
+        old = per_skill(model, phrases, resume_embeddings)
+        new = batched(model, phrases, resume_embeddings)
+        drift = max(abs(a - b) for a, b in zip(old, new))
+
+        before = summarize(time_call(lambda: per_skill(model, phrases, resume_embeddings), args.repeat))
+        after = summarize(time_call(lambda: batched(model, phrases, resume_embeddings), args.repeat))
+
+        print(f"--- {n} skills (max similarity drift {drift:.2e}) ---")
+        print_row("per-skill loop", before, f"({before['median_ms'] / n:.2f} ms/skill)")
+        print_row("batched encode", after, f"({after['median_ms'] / n:.2f} ms/skill)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Skill extraction: per-sentence spaCy EntityRuler vs one PhraseMatcher pass
+#
+# Checks that both engines agree on the built-in patterns, then reports
+# per-JD extraction time as the taxonomy grows with synthetic skills.
+#
+#   python benchmarks/bench_skill_extraction.py [--sizes 65 1000 10000]
+
+import argparse
+import random
+import string
+
+from common import time_call, summarize, print_row
+
+from models import get_nlp, get_skill_taxonomy
+from skill_matcher import build_skill_matcher
+from updated_utils import clean_text, split_sentences
+
+JD = clean_text(
+    "We are looking for professionals who are efficient with c++, machine learning, sql and python. "
+    "It's good to have skills like java but docker is a mandatory skill. "
+    "Strong communication, leadership and project management are required. "
+    "Experience with aws, kubernetes, jenkins and git is preferred. "
+    "Knowledge of react, html, css and google analytics is a plus. "
+) * 3
+
+
+def synthetic_phrases(n, seed=11):
+    rng = random.Random(seed)
+    phrases = set()
+    while len(phrases) < n:
+        words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+                 for _ in range(rng.randint(1, 3))]
+        phrases.add(" ".join(words))
+    return sorted(phrases)
+
+
+def ruler_extract(nlp, sentences):
+    found = set()
+    for sent in sentences:
+        for ent in nlp(sent).ents:
+            if ent.label_ == "SKILL":
+                found.add(ent.text.lower())
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[65, 1000, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    nlp = get_nlp()
+    sentences = split_sentences(JD)
+    taxonomy = get_skill_taxonomy()
+    base = len(taxonomy.extractable())
+
+    matcher = build_skill_matcher(taxonomy)
+    expected = ruler_extract(nlp, sentences)
+    got = set(matcher.extract(JD))
+    print(f"built-in patterns agree: {expected == got}  ({len(got)} skills)")
+    if expected != got:
+        print("  ruler only:", sorted(expected - got), " matcher only:", sorted(got - expected))
+
+    before = summarize(time_call(lambda: ruler_extract(nlp, sentences), args.repeat))
+    print_row(f"EntityRuler ({base} patterns)", before)
+
+    for size in args.sizes:
+        matcher = build_skill_matcher(taxonomy)
+        if size > base:
+            matcher.add_phrases(synthetic_phrases(size - base))
+        after = summarize(time_call(lambda: matcher.find(JD), args.repeat))
+        print_row(f"PhraseMatcher ({matcher.size} skills)", after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Talent-pool scoring: per-pair skill checks (what score_resume does, one JD
+# and one resume at a time) vs SkillMatrix's chunked sparse products with a
+# running top-k. Synthetic presence and embeddings, no encoder needed.
+#
+#   python benchmarks/bench_skill_matrix.py [--resumes 20000] [--jds 200]
+
+import time
+import random
+import argparse
+import tracemalloc
+
+from common import ROOT  # noqa: F401  (puts the repo root on sys.path)
+
+import numpy as np
+from scipy import sparse
+
+from models import get_skill_taxonomy
+from skill_matrix import SkillMatrix, SKILL_WEIGHT, SEMANTIC_WEIGHT
+
+
+def synthetic(taxonomy, n_resumes, n_jds, dim=384, seed=3):
+    rng = random.Random(seed)
+    vocab = taxonomy.extractable()
+    resumes = [rng.sample(vocab, rng.randint(3, 15)) for _ in range(n_resumes)]
+    jds = [{skill: rng.choice([1, 2, 3]) for skill in rng.sample(vocab, rng.randint(3, 10))} for _ in range(n_jds)]
+    nprng = np.random.default_rng(seed)
+    resume_vectors = nprng.standard_normal((n_resumes, dim)).astype(np.float32)
+    jd_vectors = nprng.standard_normal((n_jds, dim)).astype(np.float32)
+    return resumes, jds, resume_vectors, jd_vectors
+
+
+def per_pair(resume_skills, jd_skills, resume_vector, jd_vector):
+    total = sum(jd_skills.values())
+    matched = sum(w for skill, w in jd_skills.items() if skill in resume_skills)
+    skill_score = int(matched / total * 100)
+    semantic = float(resume_vector @ jd_vector / (np.linalg.norm(resume_vector) * np.linalg.norm(jd_vector)))
+    return min(100, int(skill_score * SKILL_WEIGHT + semantic * SEMANTIC_WEIGHT))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=20000)
+    parser.add_argument("--jds", type=int, default=200)
+    parser.add_argument("--k", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, nargs="+", default=[1024, 8192])
+    parser.add_argument("--sample-pairs", type=int, default=20000, help="per-pair calls timed, then extrapolated")
+    args = parser.parse_args()
+
+    taxonomy = get_skill_taxonomy()
+    resumes, jds, resume_vectors, jd_vectors = synthetic(taxonomy, args.resumes, args.jds)
+
+    matrix = SkillMatrix(taxonomy)
+    for i, (skills, vector) in enumerate(zip(resumes, resume_vectors)):
+        matrix.add(f"r{i}", skills, vector)
+    matrix.compile()
+
+    entries = [(j, taxonomy.ids[skill], w) for j, jd in enumerate(jds) for skill, w in jd.items()]
+    rows, cols, weights = zip(*entries)
+    W = sparse.csr_matrix((np.array(weights, dtype=np.float32), (rows, cols)), shape=(len(jds), len(taxonomy)))
+    Q = jd_vectors / np.linalg.norm(jd_vectors, axis=1, keepdims=True)
+
+    resume_sets = [set(skills) for skills in resumes]
+    pairs = args.resumes * args.jds
+    sample = min(args.sample_pairs, pairs)
+    start = time.perf_counter()
+    for p in range(sample):
+        r, j = p % args.resumes, p % args.jds
+        per_pair(resume_sets[r], jds[j], resume_vectors[r], jd_vectors[j])
+    loop = (time.perf_counter() - start) * pairs / sample
+
+    print(f"{args.resumes} resumes x {args.jds} JDs = {pairs:,} pairs, top-{args.k} per JD")
+    print(f"{'per-pair loop (extrapolated)':<32} {loop:9.2f} s")
+
+    for chunk_size in args.chunk_size:
+        tracemalloc.start()
+        start = time.perf_counter()
+        ranked = matrix.top_k_matrix(W, Q, k=args.k, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{'sparse, chunk ' + str(chunk_size):<32} {elapsed:9.2f} s   peak {peak / 2**20:.1f} MiB  (x{loop / elapsed:.0f})")
+
+    j = 0
+    check = [(c, per_pair(resume_sets[int(c[1:])], jds[j], resume_vectors[int(c[1:])], jd_vectors[j])) for c, _ in ranked[j]]
+    print(f"top-k scores agree with per-pair for JD 0: {[s for _, s in ranked[j]] == [s for _, s in check]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Skill taxonomy at scale: load time and memory of the compiled index, and
+# JD phrase embeddings from the precomputed vectors vs encoding per request
+#
+#   python benchmarks/bench_skill_taxonomy.py [--skills 20000]
+
+import os
+import json
+import random
+import string
+import argparse
+import tempfile
+import tracemalloc
+
+from common import time_call, summarize, print_row
+
+import numpy as np
+
+from models import ENCODER_KEY, get_encoder
+from skill_taxonomy import SkillTaxonomy, DEFAULT_TAXONOMY_PATH
+
+
+def synthetic_taxonomy(path, n, seed=5):
+    rng = random.Random(seed)
+    with open(DEFAULT_TAXONOMY_PATH, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    names = {s["name"] for s in data["skills"]}
+    while len(data["skills"]) < n:
+        name = " ".join("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+                        for _ in range(rng.randint(1, 3)))
+        if name not in names:
+            names.add(name)
+            aliases = [name.replace(" ", "-")] if " " in name else []
+            data["skills"].append({"name": name, "aliases": aliases, "group": rng.choice(["data", "web", "ops"])})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skills", type=int, default=20000)
+    parser.add_argument("--phrases", type=int, default=40, help="skill phrases per JD")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "skills.json")
+        synthetic_taxonomy(path, args.skills)
+
+        tracemalloc.start()
+        taxonomy = SkillTaxonomy().load(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        load = summarize(time_call(lambda: SkillTaxonomy().load(path), repeat=3))
+        print_row(f"load ({len(taxonomy)} skills)", load, f"  peak {peak / 2**20:.1f} MiB")
+
+        encoder = get_encoder()
+        build = summarize(time_call(lambda: taxonomy.load_embeddings(ENCODER_KEY, encoder, directory=tmp), repeat=1, warmup=0))
+        size = os.path.getsize(taxonomy._vector_path(ENCODER_KEY, tmp))
+        print_row("precompute embeddings (once)", build, f"  {taxonomy.vectors.shape} {size / 2**20:.1f} MiB on disk")
+
+        taxonomy.vectors = None
+        mapped = summarize(time_call(lambda: taxonomy.load_embeddings(ENCODER_KEY, encoder, directory=tmp), repeat=1, warmup=0))
+        print_row("open precomputed vectors", mapped)
+
+        phrases = random.Random(1).sample(taxonomy.names, args.phrases)
+        encode = lambda texts: encoder.encode(texts, convert_to_numpy=True)
+        before = summarize(time_call(lambda: encode(phrases), args.repeat))
+        after = summarize(time_call(lambda: taxonomy.phrase_vectors(phrases, encode), args.repeat))
+        print_row(f"encode {args.phrases} phrases", before)
+        print_row(f"lookup {args.phrases} phrases", after, f"  x{before['median_ms'] / after['median_ms']:.0f}")
+
+        drift = np.abs(taxonomy.phrase_vectors(phrases, encode) - encode(phrases)).max()
+        print(f"max abs difference vs fresh encode: {drift:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Model start-up cost: the old per-import loading vs the shared registry
+#
+# Each scenario runs in a fresh interpreter and reports wall time and peak RSS.
+# "legacy" reproduces what a cold session used to pay (app.py's own spaCy
+# pipeline, a second one with the EntityRuler in updated_utils, the
+# SentenceTransformer, NLTK probes); "registry" calls models.warm_up() from
+# two simulated sessions in the same process.
+#
+#   python benchmarks/bench_startup.py
+
+import json
+import subprocess
+import sys
+
+from common import ROOT
+
+SCENARIOS = {
+    "legacy": """
+import spacy, nltk
+from sentence_transformers import SentenceTransformer
+from models import MODEL_NAME, SPACY_MODEL, get_skill_taxonomy
+for session in range(2):
+    app_nlp = spacy.load(SPACY_MODEL)
+    nlp = spacy.load(SPACY_MODEL)
+    taxonomy = get_skill_taxonomy()
+    nlp.add_pipe("entity_ruler", before="ner").add_patterns(taxonomy.token_patterns() + taxonomy.phrase_patterns())
+    model = SentenceTransformer(MODEL_NAME)
+    nltk.data.find("tokenizers/punkt")
+""",
+    "registry": """
+import models
+for session in range(2):
+    models.warm_up()
+""",
+}
+
+HARNESS = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"seconds": elapsed, "peak_rss_mb": rss_kb / 1024}}))
+"""
+
+
+def main():
+    for name, body in SCENARIOS.items():
+        code = HARNESS.format(root=ROOT, body=body)
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{name:<10} {result['seconds']:7.2f} s   peak RSS {result['peak_rss_mb']:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
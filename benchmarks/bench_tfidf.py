@@ -0,0 +1,59 @@
+# Semantic stage of utils.calculate_match_score: per-pair TfidfVectorizer fit
+# vs the corpus model (transform + one sparse product for all resumes)
+#
+#   python benchmarks/bench_tfidf.py [--resumes 100 1000]
+
+import argparse
+import random
+import time
+
+from common import ROOT  # noqa: F401  (puts the repo root on sys.path)
+
+from tfidf_model import CorpusTfidf
+from utils import clean_text, normalize_aliases, semantic_scores
+
+WORDS = (
+    "python sql docker kubernetes aws react css html java spark airflow terraform linux "
+    "engineer team delivered platform pipelines analytics services scalable production "
+    "experience years led designed built migrated reduced latency customers product"
+).split()
+
+JD = normalize_aliases(clean_text(
+    "We need a backend engineer with python, sql and docker experience. "
+    "Kubernetes and aws are mandatory. Spark or airflow is nice to have."
+))
+
+
+def synthetic_resumes(n, seed=4, words=300):
+    rng = random.Random(seed)
+    return [normalize_aliases(clean_text(" ".join(rng.choice(WORDS) for _ in range(words)))) for _ in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--corpus", type=int, default=5000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    model = CorpusTfidf().fit(synthetic_resumes(args.corpus, seed=99))
+    print(f"fitted corpus model on {args.corpus} documents in {time.perf_counter() - start:.2f}s")
+
+    for n in args.resumes:
+        resumes = synthetic_resumes(n)
+
+        start = time.perf_counter()
+        semantic_scores(resumes, JD, tfidf_model=None)
+        per_pair = time.perf_counter() - start
+
+        start = time.perf_counter()
+        semantic_scores(resumes, JD, tfidf_model=model)
+        corpus = time.perf_counter() - start
+
+        print(f"--- {n} resumes ---")
+        print(f"{'per-pair fit':<20} {per_pair * 1000:9.1f} ms  ({per_pair * 1e6 / n:.0f} us/resume)")
+        print(f"{'corpus model':<20} {corpus * 1000:9.1f} ms  ({corpus * 1e6 / n:.0f} us/resume)")
+
+
+if __name__ == "__main__":
+    main()
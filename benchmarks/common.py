@@ -0,0 +1,32 @@
+import os
+import sys
+import time
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def time_call(fn, repeat=5, warmup=1):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "min_ms": ordered[0] * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def print_row(label, stats, extra=""):
+    print(f"{label:<32} median {stats['median_ms']:9.2f} ms   min {stats['min_ms']:9.2f} ms {extra}")
@@ -0,0 +1,74 @@
+# Deterministic, offline synthetic corpora: resumes as PDF/DOCX bytes with a
+# chosen page count, and JDs with a chosen number of skills and length.
+
+import io
+import random
+
+SKILLS = [
+    "python", "java", "c++", "javascript", "typescript", "go", "ruby", "php", "kotlin", "rust",
+    "nodejs", "machine learning", "deep learning", "data analysis", "data science", "sql", "mysql",
+    "postgresql", "mongodb", "pandas", "numpy", "tensorflow", "pytorch", "scikit-learn", "docker",
+    "kubernetes", "aws", "azure", "gcp", "devops", "git", "jenkins", "react", "angular", "vue",
+    "html", "css", "tailwind", "project management", "leadership", "communication", "teamwork",
+    "financial analysis", "excel", "seo", "digital marketing", "google analytics", "recruitment",
+]
+HEADINGS = ["Professional Summary", "Experience", "Projects", "Education", "Skills"]
+VERBS = ["Built", "Designed", "Led", "Migrated", "Optimized", "Delivered", "Automated", "Maintained"]
+OBJECTS = ["data pipelines", "REST services", "dashboards", "deployment tooling", "reporting systems",
+           "customer-facing features", "internal platforms", "ML models"]
+QUALIFIERS = ["must have", "required", "strong", "preferred", "nice to have", "a plus", "essential"]
+
+LINES_PER_PAGE = 40
+
+
+def resume_lines(rng, pages):
+    lines = []
+    for i in range(pages * LINES_PER_PAGE):
+        if i % 12 == 0:
+            lines.append(HEADINGS[(i // 12) % len(HEADINGS)])
+            continue
+        a, b = rng.sample(SKILLS, 2)
+        lines.append(f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} using {a} and {b}, improving throughput by {rng.randint(5, 60)}%.")
+    return lines
+
+
+def resume_text(pages, seed=0):
+    return "\n".join(resume_lines(random.Random(seed), pages))
+
+
+def resume_pdf(pages, seed=0):
+    import fitz
+
+    lines = resume_lines(random.Random(seed), pages)
+    doc = fitz.open()
+    for p in range(pages):
+        page = doc.new_page()
+        chunk = lines[p * LINES_PER_PAGE:(p + 1) * LINES_PER_PAGE]
+        page.insert_textbox(fitz.Rect(36, 36, 576, 806), "\n".join(chunk), fontsize=8)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def resume_docx(pages, seed=0):
+    import docx
+
+    document = docx.Document()
+    for line in resume_lines(random.Random(seed), pages):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def job_description(skills, filler_sentences=4, seed=0):
+    rng = random.Random(seed)
+    picked = rng.sample(SKILLS, min(skills, len(SKILLS)))
+    sentences = []
+    for i in range(0, len(picked), 3):
+        group = picked[i:i + 3]
+        sentences.append(f"Experience with {', '.join(group)} is {rng.choice(QUALIFIERS)}.")
+    for _ in range(filler_sentences):
+        sentences.append(f"You will work with the team on {rng.choice(OBJECTS)} in a fast-paced environment.")
+    rng.shuffle(sentences)
+    return " ".join(sentences)
@@ -0,0 +1,80 @@
+# Load test: N concurrent analyses (threads, like Streamlit sessions) calling
+# updated_utils.calculate_match_score, with and without the micro-batching
+# encoding service. Embedding caching is disabled so every analysis encodes.
+#
+#   python benchmarks/load_test_encoding.py [--sessions 50] [--max-wait-ms 5]
+
+import argparse
+import threading
+import time
+
+from common import ROOT  # noqa: F401  (puts the repo root on sys.path)
+
+import corpus
+import models
+import updated_utils
+from embedding_cache import EmbeddingCache
+from encoding_service import EncodingService
+
+
+def run(sessions, encoder):
+    original = models.get_encoder
+    models.get_encoder = lambda: encoder
+    updated_utils.get_encoder = models.get_encoder
+    updated_utils.embedding_cache = EmbeddingCache("load-test", directory=None, max_items=0)
+
+    latencies = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(sessions)
+
+    def session(i):
+        resume = corpus.resume_text(2, seed=i)
+        jd = corpus.job_description(15, seed=i)
+        barrier.wait()
+        start = time.perf_counter()
+        updated_utils.calculate_match_score(resume, jd)
+        with lock:
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    models.get_encoder = original
+    updated_utils.get_encoder = original
+    latencies.sort()
+    return {
+        "analyses_per_sec": sessions / elapsed,
+        "p50_ms": latencies[len(latencies) // 2],
+        "p99_ms": latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--max-batch-size", type=int, default=128)
+    parser.add_argument("--max-wait-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    model = models.get_sentence_model()
+    updated_utils.calculate_match_score(corpus.resume_text(1), corpus.job_description(5))
+
+    direct = run(args.sessions, model)
+    print(f"{'direct encode':<22} {direct['analyses_per_sec']:7.1f} analyses/s   "
+          f"p50 {direct['p50_ms']:8.1f} ms   p99 {direct['p99_ms']:8.1f} ms")
+
+    service = EncodingService(model, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+    batched = run(args.sessions, service)
+    print(f"{'micro-batching service':<22} {batched['analyses_per_sec']:7.1f} analyses/s   "
+          f"p50 {batched['p50_ms']:8.1f} ms   p99 {batched['p99_ms']:8.1f} ms")
+    print("service stats", service.stats())
+    service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
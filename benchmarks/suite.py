@@ -0,0 +1,201 @@
+# Reproducible benchmark suite for both scoring engines (utils and
+# updated_utils) and each of their stages, on synthetic offline corpora.
+#
+#   python benchmarks/suite.py --output results.json
+#   python benchmarks/suite.py --baseline results.json --threshold 0.25
+#
+# Results are JSON: per case p50/p95/p99 latency, throughput and the peak
+# memory allocated during one call (tracemalloc, measured after timing so it
+# doesn't skew latency; native allocations by torch or PyMuPDF are not seen).
+# With --isolate every case runs in a fresh process and also reports how far
+# it raised peak RSS above the process's state after setup.
+# With --baseline, any case whose p50 is slower than the baseline by more than
+# --threshold (fraction) is reported and the process exits with status 1.
+
+import argparse
+import io
+import json
+import platform
+import subprocess
+import resource
+import sys
+import time
+import tracemalloc
+
+from common import ROOT  # noqa: F401  (puts the repo root on sys.path)
+
+import corpus
+
+PAGES = [1, 3, 10]
+JD_SKILLS = [5, 15, 40]
+# Filler sentences around the skill sentences: JD length at a fixed skill count
+JD_LENGTHS = {"short": 0, "medium": 4, "long": 40}
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def peak_alloc_mb(fn):
+    # Peak of this call alone, unlike ru_maxrss which only ever grows
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2**20
+
+
+def percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def measure(fn, iterations, warmup=1):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    ordered = sorted(samples)
+    return {
+        "iterations": iterations,
+        "p50_ms": percentile(ordered, 50),
+        "p95_ms": percentile(ordered, 95),
+        "p99_ms": percentile(ordered, 99),
+        "throughput_per_sec": 1000 * iterations / sum(samples),
+        "peak_alloc_mb": peak_alloc_mb(fn),
+    }
+
+
+def build_cases(iterations):
+    import utils
+    import updated_utils
+    from embedding_cache import EmbeddingCache
+
+    # No embedding reuse between iterations: measure the real forward passes
+    updated_utils.embedding_cache = EmbeddingCache(updated_utils.ENCODER_KEY, directory=None, max_items=0)
+
+    cases = []
+    for pages in PAGES:
+        pdf, docx_bytes = corpus.resume_pdf(pages, seed=pages), corpus.resume_docx(pages, seed=pages)
+        text = corpus.resume_text(pages, seed=pages)
+        clean = updated_utils.clean_text(text)
+        sentences = updated_utils.split_sentences(clean)
+
+        cases += [
+            (f"extraction.pdf.{pages}p", lambda d=pdf: updated_utils.extract_text_from_pdf(io.BytesIO(d))),
+            (f"extraction.docx.{pages}p", lambda d=docx_bytes: updated_utils.extract_text_from_docx(io.BytesIO(d))),
+            (f"normalization.utils.{pages}p", lambda t=text: utils.normalize_aliases(utils.clean_text(t))),
+            (f"normalization.updated.{pages}p", lambda t=text: updated_utils.split_sentences(updated_utils.clean_text(t))),
+            (f"embedding.sentences.{pages}p", lambda s=sentences: updated_utils.encode(s)),
+        ]
+
+        for skills in JD_SKILLS:
+            jd = corpus.job_description(skills, seed=skills)
+            cases += [
+                (f"engine.utils.{pages}p.{skills}s", lambda t=text, j=jd: utils.calculate_match_score(t, j)),
+                (f"engine.updated.{pages}p.{skills}s", lambda t=text, j=jd: updated_utils.calculate_match_score(t, j)),
+            ]
+
+    for skills in JD_SKILLS:
+        jd = corpus.job_description(skills, seed=skills)
+        jd_clean = updated_utils.clean_text(jd)
+        cases += [
+            (f"skills.utils.{skills}s", lambda j=jd: utils.extract_dynamic_skills(utils.normalize_aliases(utils.clean_text(j)))),
+            (f"skills.updated.{skills}s", lambda j=jd_clean: updated_utils.extract_jd_skills(j)),
+            (f"scoring.updated.{skills}s", lambda j=jd: updated_utils.build_jd_profile(j)),
+        ]
+    text = corpus.resume_text(3, seed=3)
+    for length, filler in JD_LENGTHS.items():
+        jd = corpus.job_description(15, filler_sentences=filler, seed=15)
+        jd_clean = updated_utils.clean_text(jd)
+        cases += [
+            (f"jd.{length}.skills.updated", lambda j=jd_clean: updated_utils.extract_jd_skills(j)),
+            (f"jd.{length}.scoring.updated", lambda j=jd: updated_utils.build_jd_profile(j)),
+            (f"jd.{length}.engine.utils.3p", lambda j=jd: utils.calculate_match_score(text, j)),
+            (f"jd.{length}.engine.updated.3p", lambda j=jd: updated_utils.calculate_match_score(text, j)),
+        ]
+    return cases
+
+
+def run_isolated(name, iterations):
+    # Fresh process per case: ru_maxrss then belongs to this case alone
+    out = subprocess.run([sys.executable, __file__, "--case", name, "--iterations", str(iterations)],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run_case(name, iterations):
+    fn = dict(build_cases(iterations))[name]
+    # One call first: it loads spaCy, MiniLM and friends lazily, and that
+    # is setup, not the case
+    fn()
+    before = peak_rss_mb()
+    stats = measure(fn, iterations)
+    stats["peak_rss_delta_mb"] = peak_rss_mb() - before
+    print(json.dumps(stats))
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, current in results["cases"].items():
+        previous = baseline.get("cases", {}).get(name)
+        if not previous:
+            continue
+        change = current["p50_ms"] / previous["p50_ms"] - 1 if previous["p50_ms"] else 0.0
+        if change > threshold:
+            regressions.append((name, previous["p50_ms"], current["p50_ms"], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed p50 slowdown (0.25 = 25%%)")
+    parser.add_argument("--isolate", action="store_true", help="run every case in its own process")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        run_case(args.case, args.iterations)
+        return 0
+
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "cases": {},
+    }
+    for name, fn in build_cases(args.iterations):
+        if args.filter not in name:
+            continue
+        stats = run_isolated(name, args.iterations) if args.isolate else measure(fn, args.iterations)
+        results["cases"][name] = stats
+        rss = f"  rss +{stats['peak_rss_delta_mb']:7.1f} MB" if args.isolate else ""
+        print(f"{name:<36} p50 {stats['p50_ms']:9.2f} ms  p95 {stats['p95_ms']:9.2f} ms  "
+              f"{stats['throughput_per_sec']:9.1f}/s  alloc {stats['peak_alloc_mb']:7.1f} MB{rss}")
+
+    results["peak_rss_mb"] = peak_rss_mb()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for name, before, after, change in regressions:
+            print(f"REGRESSION {name}: p50 {before:.2f} -> {after:.2f} ms (+{change:.0%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+import os
+import json
+
+import numpy as np
+
+from similarity import normalize
+
+# Candidate search over stored resume embeddings:
+#   - normalized full-resume vectors in one contiguous float32 matrix
+#   - per-sentence vectors in a second contiguous matrix, sliced per candidate
+#   - optional IVF (k-means coarse quantizer) for approximate retrieval
+# A JD is embedded once, top-k rows come from a dot product, and only those
+# candidates are re-scored with updated_utils.score_resume.
+
+
+def _grow(matrix, rows):
+    if rows <= matrix.shape[0]:
+        return matrix
+    grown = np.zeros((max(rows, matrix.shape[0] * 2, 1024), matrix.shape[1]), dtype=np.float32)
+    grown[:matrix.shape[0]] = matrix
+    return grown
+
+
+def _grow_mask(mask, rows):
+    if rows <= len(mask):
+        return mask
+    grown = np.zeros(max(rows, len(mask) * 2, 1024), dtype=bool)
+    grown[:len(mask)] = mask
+    return grown
+
+
+def _kmeans(data, k, iters=10, seed=0):
+    rng = np.random.default_rng(seed)
+    centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+    for _ in range(iters):
+        assign = np.argmax(data @ centroids.T, axis=1)
+        for c in range(k):
+            members = data[assign == c]
+            if len(members):
+                centroids[c] = members.mean(axis=0)
+        centroids = normalize(centroids)
+    return centroids
+
+
+# ---------------- INDEX ----------------
+class CandidateIndex:
+    def __init__(self, dim=384):
+        self.dim = dim
+        self.doc_matrix = np.zeros((0, dim), dtype=np.float32)
+        self.sentence_matrix = np.zeros((0, dim), dtype=np.float32)
+        self.size = 0
+        self.sentence_count = 0
+
+        self.ids = []
+        self.texts = []
+        self.spans = []
+        self.alive = np.zeros(0, dtype=bool)
+        self.rows = {}
+
+        self.centroids = None
+        self.lists = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    # ---------- mutation ----------
+    def add(self, candidate, resume_clean, sentence_embeddings, doc_embedding):
+        if candidate in self.rows:
+            self.delete(candidate)
+
+        sentence_embeddings = normalize(np.reshape(sentence_embeddings, (-1, self.dim)))
+        row = self.size
+        self.doc_matrix = _grow(self.doc_matrix, row + 1)
+        self.doc_matrix[row] = normalize(doc_embedding)
+        self.size += 1
+
+        start = self.sentence_count
+        if len(sentence_embeddings):
+            # After load(mmap=True) the matrix is a read-only memmap until
+            # _grow copies it, so nothing is written for an empty resume
+            self.sentence_matrix = _grow(self.sentence_matrix, start + len(sentence_embeddings))
+            self.sentence_matrix[start:start + len(sentence_embeddings)] = sentence_embeddings
+            self.sentence_count += len(sentence_embeddings)
+
+        self.ids.append(candidate)
+        self.texts.append(resume_clean)
+        self.spans.append((start, self.sentence_count))
+        self.alive = _grow_mask(self.alive, row + 1)
+        self.alive[row] = True
+        self.rows[candidate] = row
+
+        if self.centroids is not None:
+            self.lists[int(np.argmax(self.centroids @ self.doc_matrix[row]))].append(row)
+        return row
+
+    def add_text(self, candidate, raw_text):
+        from updated_utils import clean_text, split_sentences, encode, document_embedding
+
+        resume_clean = clean_text(raw_text)
+        sentences = split_sentences(resume_clean)
+        embeddings = encode(sentences)
+        doc_embedding = document_embedding(sentences, embeddings) if sentences else encode([resume_clean])[0]
+        return self.add(candidate, resume_clean, embeddings, doc_embedding)
+
+    def delete(self, candidate):
+        row = self.rows.pop(candidate, None)
+        if row is None:
+            return False
+        # Tombstone; storage is reclaimed by compact()
+        self.alive[row] = False
+        self.texts[row] = None
+        if self.size > 1024 and len(self.rows) < self.size // 2:
+            self.compact()
+        return True
+
+    def compact(self):
+        live = np.flatnonzero(self.alive[:self.size])
+        doc_matrix = self.doc_matrix[live].copy()
+        pieces, spans, start = [], [], 0
+        for row in live:
+            s, e = self.spans[row]
+            pieces.append(self.sentence_matrix[s:e])
+            spans.append((start, start + e - s))
+            start += e - s
+
+        self.sentence_matrix = np.concatenate(pieces) if pieces else np.zeros((0, self.dim), dtype=np.float32)
+        self.sentence_count = start
+        self.doc_matrix = doc_matrix
+        self.ids = [self.ids[r] for r in live]
+        self.texts = [self.texts[r] for r in live]
+        self.spans = spans
+        self.size = len(live)
+        self.alive = np.ones(self.size, dtype=bool)
+        self.rows = {c: i for i, c in enumerate(self.ids)}
+
+        if self.centroids is not None:
+            self._assign_lists()
+
+    # ---------- approximate index ----------
+    def build_ivf(self, nlist=None, iters=10):
+        live = np.flatnonzero(self.alive[:self.size])
+        if not len(live):
+            return
+        nlist = nlist or max(1, int(np.sqrt(len(live))))
+        self.centroids = _kmeans(self.doc_matrix[live], min(nlist, len(live)), iters=iters)
+        self._assign_lists()
+
+    def _assign_lists(self):
+        self.lists = [[] for _ in range(len(self.centroids))]
+        live = np.flatnonzero(self.alive[:self.size])
+        if len(live):
+            assign = np.argmax(self.doc_matrix[live] @ self.centroids.T, axis=1)
+            for row, c in zip(live, assign):
+                self.lists[c].append(int(row))
+
+    # ---------- queries ----------
+    def search_vector(self, query, k=50, nprobe=None):
+        query = normalize(query)
+        if self.centroids is not None and nprobe:
+            probes = np.argsort(-(self.centroids @ query))[:nprobe]
+            rows = np.fromiter((r for c in probes for r in self.lists[c]), dtype=np.int64)
+            rows = rows[self.alive[rows]]
+            scores = self.doc_matrix[rows] @ query
+        else:
+            # Brute force straight over the contiguous matrix, no gather copy
+            rows = np.flatnonzero(self.alive[:self.size])
+            scores = (self.doc_matrix[:self.size] @ query)[rows]
+        if not len(rows):
+            return [], np.zeros(0, dtype=np.float32)
+
+        k = min(k, len(rows))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [self.ids[r] for r in rows[top]], scores[top]
+
+    def search(self, jd_text, k=50, nprobe=None):
+        import pandas as pd
+        from updated_utils import build_jd_profile, split_sentences, encode, document_embedding, score_resume
+
+        # The JD is parsed and embedded once for retrieval and re-scoring
+        profile = build_jd_profile(jd_text)
+        query = profile["embedding"]
+        if query is None:
+            sentences = split_sentences(profile["clean"]) or [profile["clean"]]
+            query = document_embedding(sentences, encode(sentences))
+        candidates, similarities = self.search_vector(query, k=k, nprobe=nprobe)
+
+        rows = []
+        for candidate, similarity in zip(candidates, similarities):
+            row = self.rows[candidate]
+            start, end = self.spans[row]
+            if end > start:
+                score, matched, missing = score_resume(self.texts[row], self.sentence_matrix[start:end],
+                                                       self.doc_matrix[row], profile)
+            else:
+                score, matched, missing = 0, [], []
+            rows.append({
+                "candidate": candidate,
+                "retrieval_similarity": float(similarity),
+                "score": score,
+                "matched": matched,
+                "missing": missing,
+            })
+
+        columns = ["candidate", "retrieval_similarity", "score", "matched", "missing"]
+        ranked = pd.DataFrame(rows, columns=columns)
+        ranked = ranked.sort_values("score", ascending=False, kind="stable").reset_index(drop=True)
+        ranked.insert(0, "rank", range(1, len(ranked) + 1))
+        return ranked
+
+    # ---------- persistence ----------
+    def save(self, directory):
+        self.compact()
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "docs.npy"), self.doc_matrix[:self.size])
+        np.save(os.path.join(directory, "sentences.npy"), self.sentence_matrix[:self.sentence_count])
+        if self.centroids is not None:
+            np.save(os.path.join(directory, "centroids.npy"), self.centroids)
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "ids": self.ids, "texts": self.texts, "spans": self.spans}, f)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        with open(os.path.join(directory, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        mode = "r" if mmap else None
+
+        index = cls(meta["dim"])
+        index.doc_matrix = np.array(np.load(os.path.join(directory, "docs.npy"), mmap_mode=mode))
+        index.sentence_matrix = np.load(os.path.join(directory, "sentences.npy"), mmap_mode=mode)
+        index.size = len(meta["ids"])
+        index.sentence_count = index.sentence_matrix.shape[0]
+        index.ids = meta["ids"]
+        index.texts = meta["texts"]
+        index.spans = [tuple(s) for s in meta["spans"]]
+        index.alive = np.ones(index.size, dtype=bool)
+        index.rows = {c: i for i, c in enumerate(index.ids)}
+
+        centroids_path = os.path.join(directory, "centroids.npy")
+        if os.path.exists(centroids_path):
+            index.centroids = np.load(centroids_path)
+            index._assign_lists()
+        return index
@@ -0,0 +1,201 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+# ---------------- CONFIG ----------------
+# Unset: memory only. Parsed documents are candidate data, so persisting them
+# is opt-in
+DEFAULT_CACHE_DIR = os.environ.get("SKILLSYNC_DOCUMENT_CACHE")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# The directory is bounded too: oldest files go first past the size cap, and
+# files older than the age cap (seconds) are never served
+DEFAULT_MAX_DISK_BYTES = int(os.environ.get("SKILLSYNC_DOCUMENT_CACHE_MAX_BYTES", 1024 * 1024 * 1024))
+DEFAULT_MAX_AGE = float(os.environ.get("SKILLSYNC_DOCUMENT_CACHE_MAX_AGE", 7 * 24 * 3600))
+
+
+def digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _size(document):
+    return len(document["text"]) + len(document["clean"]) + sum(len(s) for s in document["sentences"])
+
+
+# ---------------- CACHE ----------------
+class DocumentCache:
+    # Parsed uploads keyed by sha256 of the file bytes: extracted text,
+    # cleaned text and sentence splits. Memory is an LRU bounded by the total
+    # size of the stored strings; with a directory, every document is also
+    # written as <digest>.json so other processes and restarts reuse it. The
+    # directory is a FIFO bounded by file size and age, tracked per process
+    # from a scan at startup plus its own writes.
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES,
+                 max_disk_bytes=DEFAULT_MAX_DISK_BYTES, max_age=DEFAULT_MAX_AGE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age = max_age
+
+        self._memory = OrderedDict()
+        self._bytes = 0
+        self._files = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+        if directory:
+            try:
+                os.makedirs(directory, exist_ok=True)
+                self._scan()
+            except OSError as e:
+                log.warning("document cache %s unusable, continuing in memory only: %s", directory, e)
+                self.directory = None
+
+    # ---------- disk layer ----------
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _scan(self):
+        # Oldest first, the order _trim_disk evicts in
+        now = time.time()
+        found = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self.max_age:
+                    self._remove(entry.path)
+                else:
+                    found.append((stat.st_mtime, entry.name[:-len(".json")], stat.st_size))
+        for _, key, size in sorted(found):
+            self._files[key] = size
+            self._disk_bytes += size
+        self._trim_disk()
+
+    def _trim_disk(self):
+        while self._disk_bytes > self.max_disk_bytes and self._files:
+            key, size = self._files.popitem(last=False)
+            self._disk_bytes -= size
+            self._remove(self._path(key))
+            self.disk_evictions += 1
+
+    def _read(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                expired = time.time() - os.fstat(f.fileno()).st_mtime > self.max_age
+                if not expired:
+                    return json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._remove(path)
+        with self._lock:
+            self._disk_bytes -= self._files.pop(key, 0)
+        return None
+
+    def _write(self, key, document):
+        tmp = self._path(key) + f".{os.getpid()}.{threading.get_ident()}.tmp"
+        # ASCII-escaped, so the string length is the file size
+        payload = json.dumps(document)
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            # A full or read-only disk only costs the persistence
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        with self._lock:
+            self._disk_bytes += len(payload) - self._files.pop(key, 0)
+            self._files[key] = len(payload)
+            self._trim_disk()
+
+    # ---------- memory layer ----------
+    def _remember(self, key, document):
+        size = _size(document)
+        if size > self.max_bytes:
+            return
+        if key in self._memory:
+            self._bytes -= _size(self._memory.pop(key))
+        self._memory[key] = document
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._bytes -= _size(evicted)
+            self.evictions += 1
+
+    # ---------- public ----------
+    def get(self, key):
+        with self._lock:
+            document = self._memory.get(key)
+            if document is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return document
+
+        document = self._read(key) if self.directory else None
+        with self._lock:
+            if document is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, document)
+        return document
+
+    def put(self, key, document):
+        with self._lock:
+            self._remember(key, document)
+        if self.directory:
+            self._write(key, document)
+
+    def get_or_parse(self, data, parse):
+        # parse(data) -> {"text", "clean", "sentences"}; runs once per unique file
+        key = digest(data)
+        document = self.get(key)
+        if document is None:
+            document = parse(data)
+            self.put(key, document)
+        return key, document
+
+    def stats(self):
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_items": len(self._memory),
+            "memory_bytes": self._bytes,
+            "evictions": self.evictions,
+            "persistent": bool(self.directory),
+            "disk_items": len(self._files),
+            "disk_bytes": self._disk_bytes,
+            "disk_evictions": self.disk_evictions,
+        }
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+            self._bytes = 0
@@ -0,0 +1,65 @@
+import io
+import os
+
+import fitz
+import docx
+
+from worker_pools import pool_map
+
+# ---------------- LIMITS ----------------
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+MAX_PDF_PAGES = 60
+MAX_DOCX_PARAGRAPHS = 5000
+
+# Below this many pages a worker round-trip costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 16
+PDF_WORKERS = min(4, os.cpu_count() or 1)
+
+
+class DocumentTooLargeError(ValueError):
+    pass
+
+
+def read_upload(file, max_bytes=MAX_UPLOAD_BYTES):
+    file.seek(0)
+    data = file.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise DocumentTooLargeError(f"Upload exceeds {max_bytes // (1024 * 1024)} MB limit")
+    return data
+
+
+# ---------------- PDF ----------------
+def iter_pdf_pages(data, start=0, stop=None):
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        stop = doc.page_count if stop is None else min(stop, doc.page_count)
+        for i in range(start, stop):
+            yield doc.load_page(i).get_text()
+
+
+def _extract_page_range(data, start, stop):
+    return "".join(iter_pdf_pages(data, start, stop))
+
+
+def extract_pdf_text(file, max_pages=MAX_PDF_PAGES, max_bytes=MAX_UPLOAD_BYTES, workers=None):
+    workers = PDF_WORKERS if workers is None else workers
+    data = read_upload(file, max_bytes)
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        page_count = min(doc.page_count, max_pages)
+
+    if workers <= 1 or page_count < PARALLEL_PAGE_THRESHOLD:
+        return "".join(iter_pdf_pages(data, 0, page_count))
+
+    # Contiguous page ranges, one per worker, joined back in page order
+    step = -(-page_count // workers)
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    parts = pool_map("pdf", workers, _extract_page_range, [data] * len(ranges), *zip(*ranges))
+    return "".join(parts)
+
+
+# ---------------- DOCX ----------------
+def iter_docx_paragraphs(file, max_bytes=MAX_UPLOAD_BYTES, max_paragraphs=MAX_DOCX_PARAGRAPHS):
+    doc = docx.Document(io.BytesIO(read_upload(file, max_bytes)))
+    for i, para in enumerate(doc.paragraphs):
+        if i >= max_paragraphs:
+            break
+        yield para.text
@@ -0,0 +1,260 @@
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no cross-process locking, one writer per directory
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+# ---------------- CONFIG ----------------
+DEFAULT_CACHE_DIR = os.environ.get(
+    "SKILLSYNC_EMBEDDING_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "skillsync", "embeddings")
+)
+DEFAULT_MEMORY_ITEMS = 50_000
+
+ARENA_FILE = "arena.f32"
+INDEX_FILE = "index.log"
+LOCK_FILE = "arena.lock"
+
+
+def normalize_text(text):
+    return " ".join(text.split())
+
+
+# ---------------- CACHE ----------------
+class EmbeddingCache:
+    # Two layers keyed by sha256(model name + normalized text):
+    #   - an in-process LRU of float32 vectors
+    #   - an append-only float32 arena on disk, memory-mapped for reads, plus a
+    #     "key row" index log so a restarted process finds earlier embeddings
+    def __init__(self, model_name, directory=DEFAULT_CACHE_DIR, max_items=DEFAULT_MEMORY_ITEMS):
+        self.model_name = model_name
+        self.directory = directory
+        self.max_items = max_items
+
+        self._memory = OrderedDict()
+        self._rows = {}
+        self._dim = None
+        self._arena = None
+        self._arena_rows = 0
+        self._index_offset = 0
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if directory:
+            try:
+                os.makedirs(directory, exist_ok=True)
+                self._load_index()
+            except OSError as e:
+                self._disable_disk(e)
+
+    def key(self, text):
+        payload = f"{self.model_name}\0{normalize_text(text)}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    # ---------- disk layer ----------
+    def _disable_disk(self, error):
+        # Unwritable, full or missing cache dir: this process goes on with the
+        # memory layer only, as skill_taxonomy does with its vectors
+        log.warning("embedding cache %s unusable, continuing in memory only: %s", self.directory, error)
+        self.directory = None
+        self._rows = {}
+        self._arena = None
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _load_index(self):
+        # Rows written to the arena but never indexed (crash mid-write) are
+        # never referenced: index lines are appended only after their rows
+        self._index_offset = 0
+        self._refresh_index()
+        if self._dim and self._rows:
+            # Arenas from before locked appends could be truncated under their index
+            arena = self._path(ARENA_FILE)
+            rows = os.path.getsize(arena) // (4 * self._dim) if os.path.exists(arena) else 0
+            self._rows = {k: r for k, r in self._rows.items() if r < rows}
+            self._arena_rows = min(self._arena_rows, rows)
+
+    def _refresh_index(self):
+        # Picks up entries appended since the last read, including those of
+        # other processes sharing the directory. Only complete lines count.
+        try:
+            f = open(self._path(INDEX_FILE), "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            f.seek(self._index_offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        if not end:
+            return
+        lines = data[:end].decode("utf-8").splitlines()
+        if self._index_offset == 0:
+            header = lines.pop(0).split()
+            if len(header) != 2 or header[0] != "dim":
+                self._index_offset = end
+                return
+            if self._dim is None:
+                self._dim = int(header[1])
+            elif self._dim != int(header[1]):
+                # Arena of another dimensionality: leave it alone
+                self.directory = None
+                return
+        self._index_offset += end
+
+        for line in lines:
+            parts = line.split()
+            if len(parts) == 2:
+                row = int(parts[1])
+                self._rows.setdefault(parts[0], row)
+                self._arena_rows = max(self._arena_rows, row + 1)
+
+    def _disk_view(self):
+        if self._arena is None or self._arena.shape[0] != self._arena_rows:
+            if not self._arena_rows:
+                return None
+            self._arena = np.memmap(self._path(ARENA_FILE), dtype=np.float32, mode="r",
+                                    shape=(self._arena_rows, self._dim))
+        return self._arena
+
+    def _append_disk(self, keys, vectors):
+        # Several processes (app, API, indexes, benchmarks) share one
+        # directory: appends and index writes happen under an exclusive file
+        # lock, at the real end of the arena, after catching up on the index
+        with open(self._path(LOCK_FILE), "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if self._dim is None:
+                    self._refresh_index()
+                if self._dim is None:
+                    self._dim = vectors.shape[1]
+                    with open(self._path(INDEX_FILE), "w", encoding="utf-8") as f:
+                        f.write(f"dim {self._dim}\n")
+                    self._index_offset = os.path.getsize(self._path(INDEX_FILE))
+                else:
+                    self._refresh_index()
+                if not self.directory or vectors.shape[1] != self._dim:
+                    return
+
+                fresh = [i for i, k in enumerate(keys) if k not in self._rows]
+                if not fresh:
+                    return
+                row_bytes = 4 * self._dim
+                with open(self._path(ARENA_FILE), "ab") as f:
+                    size = os.fstat(f.fileno()).st_size
+                    # A crashed writer may have left a partial row: pad past it
+                    start = -(-size // row_bytes)
+                    f.write(b"\0" * (start * row_bytes - size))
+                    f.write(np.ascontiguousarray(vectors[fresh], dtype=np.float32).tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                lines = []
+                for row, i in enumerate(fresh, start):
+                    self._rows[keys[i]] = row
+                    lines.append(f"{keys[i]} {row}\n")
+                self._arena_rows = max(self._arena_rows, start + len(fresh))
+
+                with open(self._path(INDEX_FILE), "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+                self._index_offset = os.path.getsize(self._path(INDEX_FILE))
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    # ---------- memory layer ----------
+    def _remember(self, k, vector):
+        self._memory[k] = vector
+        self._memory.move_to_end(k)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, k):
+        vector = self._memory.get(k)
+        if vector is not None:
+            self._memory.move_to_end(k)
+            self.memory_hits += 1
+            return vector
+
+        row = self._rows.get(k)
+        if row is not None:
+            try:
+                vector = np.array(self._disk_view()[row])
+            except OSError as e:
+                self._disable_disk(e)
+            else:
+                self._remember(k, vector)
+                self.disk_hits += 1
+                return vector
+
+        self.misses += 1
+        return None
+
+    # ---------- public API ----------
+    def encode(self, model, texts, batch_size=128):
+        keys = [self.key(t) for t in texts]
+        vectors = [None] * len(texts)
+        pending = {}
+
+        with self._lock:
+            if self.directory and any(k not in self._memory and k not in self._rows for k in keys):
+                try:
+                    self._refresh_index()
+                except OSError as e:
+                    self._disable_disk(e)
+            for i, k in enumerate(keys):
+                vectors[i] = self._lookup(k)
+                if vectors[i] is None:
+                    pending.setdefault(k, []).append(i)
+
+        if pending:
+            # Only the unseen texts reach the SentenceTransformer forward pass
+            todo = list(pending)
+            encoded = model.encode([texts[pending[k][0]] for k in todo], batch_size=batch_size,
+                                   convert_to_numpy=True).astype(np.float32, copy=False)
+
+            with self._lock:
+                for k, vector in zip(todo, encoded):
+                    self._remember(k, vector)
+                    for i in pending[k]:
+                        vectors[i] = vector
+                if self.directory:
+                    try:
+                        self._append_disk(todo, encoded)
+                    except OSError as e:
+                        self._disable_disk(e)
+
+        if not vectors:
+            return np.zeros((0, self._dim or 0), dtype=np.float32)
+        return np.stack(vectors)
+
+    def stats(self):
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "model": self.model_name,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_items": len(self._memory),
+            "disk_items": len(self._rows),
+            "disk_bytes": self._arena_rows * 4 * (self._dim or 0),
+        }
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
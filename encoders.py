@@ -0,0 +1,162 @@
+import os
+import sys
+
+import numpy as np
+
+# Pluggable CPU encoder backends for the MiniLM sentence model. Every backend
+# exposes the subset of the SentenceTransformer API the engine uses:
+# encode(texts, batch_size=..., convert_to_numpy=True) -> float32 (n, dim)
+# and get_sentence_embedding_dimension().
+#
+#   torch  - SentenceTransformer, float32 PyTorch (default)
+#   int8   - the same model with Linear layers dynamically quantized to int8
+#   onnx   - ONNX Runtime on an exported model directory (model.onnx or
+#            model_quantized.onnx + tokenizer.json), see export_onnx()
+#
+# Tolerance versus the torch backend, checked by benchmarks/bench_encoders.py:
+# per-pair cosine similarity within SIMILARITY_TOLERANCE and final match
+# scores within SCORE_TOLERANCE points.
+
+SIMILARITY_TOLERANCE = 0.02
+SCORE_TOLERANCE = 2
+MAX_SEQ_LENGTH = 256
+
+
+# ---------------- TORCH ----------------
+class TorchEncoder:
+    backend = "torch"
+
+    def __init__(self, model_name):
+        from sentence_transformers import SentenceTransformer
+
+        self.model_name = model_name
+        self.model = SentenceTransformer(model_name, device="cpu")
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, **kwargs):
+        kwargs.pop("convert_to_tensor", None)
+        return self.model.encode(texts, batch_size=batch_size, convert_to_numpy=True, **kwargs).astype(np.float32, copy=False)
+
+    def get_sentence_embedding_dimension(self):
+        return self.model.get_sentence_embedding_dimension()
+
+
+class QuantizedTorchEncoder(TorchEncoder):
+    backend = "int8"
+
+    def __init__(self, model_name):
+        import torch
+
+        super().__init__(model_name)
+        self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+# ---------------- ONNX RUNTIME ----------------
+class OnnxEncoder:
+    backend = "onnx"
+
+    def __init__(self, model_dir, threads=None):
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError("The onnx encoder backend needs `pip install onnxruntime tokenizers`") from e
+
+        model_path = os.path.join(model_dir, "model_quantized.onnx")
+        if not os.path.exists(model_path):
+            model_path = os.path.join(model_dir, "model.onnx")
+
+        options = ort.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(MAX_SEQ_LENGTH)
+        self.tokenizer.enable_padding()
+        self.model_name = model_dir
+
+    def _encode_batch(self, texts):
+        encodings = self.tokenizer.encode_batch(texts)
+        ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": ids, "attention_mask": mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.zeros_like(ids)
+
+        hidden = self.session.run(None, feeds)[0]
+        # Mean pooling over real tokens, then L2 normalization, as in the
+        # SentenceTransformer pipeline for all-MiniLM-L6-v2
+        weights = mask[..., None].astype(np.float32)
+        pooled = (hidden * weights).sum(axis=1) / np.maximum(weights.sum(axis=1), 1e-9)
+        return pooled / np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, **kwargs):
+        if isinstance(texts, str):
+            return self.encode([texts], batch_size)[0]
+        if not texts:
+            return np.zeros((0, self.get_sentence_embedding_dimension()), dtype=np.float32)
+
+        # Length-sorted batches keep padding small
+        order = np.argsort([len(t) for t in texts])
+        out = [None] * len(texts)
+        for start in range(0, len(texts), batch_size):
+            idx = order[start:start + batch_size]
+            for i, vector in zip(idx, self._encode_batch([texts[i] for i in idx])):
+                out[i] = vector
+        return np.stack(out).astype(np.float32, copy=False)
+
+    def get_sentence_embedding_dimension(self):
+        shape = self.session.get_outputs()[0].shape
+        return shape[-1] if isinstance(shape[-1], int) else 384
+
+
+# ---------------- FACTORY ----------------
+def load_encoder(backend, model_name, onnx_dir=None):
+    if backend == "torch":
+        return TorchEncoder(model_name)
+    if backend == "int8":
+        return QuantizedTorchEncoder(model_name)
+    if backend == "onnx":
+        if not onnx_dir:
+            raise ValueError("SKILLSYNC_ONNX_DIR must point at an exported model directory")
+        return OnnxEncoder(onnx_dir)
+    raise ValueError(f"Unknown encoder backend: {backend!r} (expected torch, int8 or onnx)")
+
+
+def export_onnx(model_name, out_dir, quantize=True):
+    # One-off export from the locally cached SentenceTransformer weights
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(out_dir, exist_ok=True)
+    st_model = SentenceTransformer(model_name, device="cpu")
+    transformer = st_model[0].auto_model.eval()
+    tokenizer = st_model.tokenizer
+    tokenizer.save_pretrained(out_dir)
+
+    sample = tokenizer(["export sample"], return_tensors="pt")
+    model_path = os.path.join(out_dir, "model.onnx")
+    torch.onnx.export(
+        transformer,
+        (sample["input_ids"], sample["attention_mask"], sample["token_type_ids"]),
+        model_path,
+        input_names=["input_ids", "attention_mask", "token_type_ids"],
+        output_names=["last_hidden_state"],
+        dynamic_axes={name: {0: "batch", 1: "sequence"} for name in
+                      ["input_ids", "attention_mask", "token_type_ids", "last_hidden_state"]},
+        opset_version=14,
+    )
+
+    if quantize:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        quantize_dynamic(model_path, os.path.join(out_dir, "model_quantized.onnx"), weight_type=QuantType.QInt8)
+    return out_dir
+
+
+if __name__ == "__main__":
+    # python encoders.py <out_dir> [--no-quantize]
+    from models import MODEL_NAME
+
+    export_onnx(MODEL_NAME, sys.argv[1], quantize="--no-quantize" not in sys.argv)
+    print(f"exported {MODEL_NAME} to {sys.argv[1]}")
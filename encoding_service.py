@@ -0,0 +1,193 @@
+import time
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+# In-process dynamic micro-batching for the sentence encoder. Callers from any
+# thread (every Streamlit session runs on its own) submit texts and get a
+# Future; one worker thread coalesces pending requests into a single encode
+# call bounded by max_batch_size texts and max_wait_ms of queueing delay.
+# Only the worker touches the model, so torch's intra-op threads are never
+# contended by concurrent sessions.
+#
+# Requests are cut into slices of at most max_batch_size (or the caller's
+# smaller batch_size) texts, and every batch takes at most one slice per
+# request, round-robin: a bulk screen of thousands of sentences shares the
+# encoder with interactive sessions instead of holding it for its whole
+# length. If a coalesced encode fails, its slices are retried one by one so
+# only the request that caused it fails.
+
+DEFAULT_MAX_BATCH_SIZE = 128
+DEFAULT_MAX_WAIT_MS = 5
+
+
+class _Request:
+    def __init__(self, texts, future, slice_size):
+        self.texts = texts
+        self.future = future
+        self.slices = deque((start, min(start + slice_size, len(texts)))
+                            for start in range(0, len(texts), slice_size))
+        self.parts = [None] * len(self.slices)
+        self.index = 0
+        self.remaining = len(self.slices)
+
+    def next_slice(self):
+        start, stop = self.slices.popleft()
+        self.index += 1
+        return self.index - 1, start, stop
+
+
+class EncodingService:
+    def __init__(self, encoder, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait_ms=DEFAULT_MAX_WAIT_MS):
+        self.encoder = encoder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._active = deque()
+        self._stopping = False
+        self._closed = False
+
+        self.batches = 0
+        self.texts = 0
+        self.requests = 0
+        self.slices = 0
+        self.failed_batches = 0
+
+        self._worker = threading.Thread(target=self._run, name="encoding-service", daemon=True)
+        self._worker.start()
+
+    # ---------- client side ----------
+    def submit(self, texts, batch_size=None):
+        future = Future()
+        if self._closed:
+            future.set_exception(RuntimeError("EncodingService is shut down"))
+        elif not texts:
+            future.set_result(np.zeros((0, self.get_sentence_embedding_dimension()), dtype=np.float32))
+        else:
+            slice_size = min(batch_size or self.max_batch_size, self.max_batch_size)
+            self._queue.put(_Request(list(texts), future, slice_size))
+        return future
+
+    def encode(self, texts, batch_size=None, convert_to_numpy=True, **kwargs):
+        # Drop-in for encoder.encode, so EmbeddingCache can sit in front of it
+        if isinstance(texts, str):
+            return self.submit([texts], batch_size).result()[0]
+        return self.submit(texts, batch_size).result()
+
+    def get_sentence_embedding_dimension(self):
+        return self.encoder.get_sentence_embedding_dimension()
+
+    # ---------- worker side ----------
+    def _accept(self, item):
+        if item is None:
+            self._stopping = True
+        else:
+            self._active.append(item)
+
+    def _queued_texts(self):
+        return sum(len(r.texts) for r in self._active)
+
+    def _collect(self):
+        # -> [(request, slice index, start, stop)] for one encode call
+        if not self._active:
+            if self._stopping:
+                return None
+            self._accept(self._queue.get())
+            if not self._active:
+                return None
+
+        deadline = time.perf_counter() + self.max_wait
+        while not self._stopping and self._queued_texts() < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                self._accept(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        while True:
+            try:
+                self._accept(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        batch, size = [], 0
+        for _ in range(len(self._active)):
+            request = self._active[0]
+            start, stop = request.slices[0]
+            if batch and size + stop - start > self.max_batch_size:
+                break
+            self._active.popleft()
+            batch.append((request,) + request.next_slice())
+            size += stop - start
+            if request.slices:
+                self._active.append(request)
+        return batch
+
+    def _encode(self, batch):
+        flat = [t for request, _, start, stop in batch for t in request.texts[start:stop]]
+        return self.encoder.encode(flat, batch_size=self.max_batch_size, convert_to_numpy=True)
+
+    def _deliver(self, request, index, vectors):
+        if request.future.done():
+            return
+        request.parts[index] = vectors
+        request.remaining -= 1
+        if not request.remaining:
+            request.future.set_result(request.parts[0] if len(request.parts) == 1 else np.concatenate(request.parts))
+            self.requests += 1
+
+    def _fail(self, request, error):
+        if not request.future.done():
+            request.future.set_exception(error)
+        if request in self._active:
+            self._active.remove(request)
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+
+            try:
+                vectors = self._encode(batch)
+            except Exception:
+                # Retry alone so one bad input doesn't fail every caller
+                self.failed_batches += 1
+                for item in batch:
+                    if item[0].future.done():
+                        continue
+                    try:
+                        self._deliver(item[0], item[1], self._encode([item]))
+                    except Exception as e:
+                        self._fail(item[0], e)
+                continue
+
+            offset = 0
+            for request, index, start, stop in batch:
+                self._deliver(request, index, vectors[offset:offset + stop - start])
+                offset += stop - start
+
+            self.batches += 1
+            self.slices += len(batch)
+            self.texts += offset
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "texts": self.texts,
+            "mean_batch_texts": self.texts / self.batches if self.batches else 0.0,
+            # At most one slice per request per batch
+            "mean_requests_per_batch": self.slices / self.batches if self.batches else 0.0,
+            "failed_batches": self.failed_batches,
+            "queued": self._queue.qsize() + len(self._active),
+        }
+
+    def shutdown(self):
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join()
@@ -0,0 +1,265 @@
+import os
+import sys
+import json
+import time
+import queue
+import hashlib
+import argparse
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Batch ingestion for resume folders:
+#
+#   parse (process pool) -> bounded queue -> batched encoder -> parquet parts
+#
+# Each part is written completely before its files are appended to
+# manifest.jsonl, so a crashed run resumes by skipping manifest entries.
+#
+#   python ingest.py /mnt/resumes ./resume_store --workers 6
+
+SUPPORTED = (".pdf", ".docx")
+MANIFEST_FILE = "manifest.jsonl"
+
+
+# ---------------- DISCOVERY & RESUME ----------------
+def discover(source):
+    paths = []
+    for root, _, files in os.walk(source):
+        for name in files:
+            if name.lower().endswith(SUPPORTED):
+                paths.append(os.path.abspath(os.path.join(root, name)))
+    return sorted(paths)
+
+
+def file_key(path):
+    stat = os.stat(path)
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def load_manifest(output):
+    done, parts = set(), set()
+    path = os.path.join(output, MANIFEST_FILE)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    done.add(entry["key"])
+                except (ValueError, KeyError):
+                    # Torn last line from a crash: that file is simply redone
+                    continue
+                if entry.get("part"):
+                    parts.add(entry["part"])
+    return done, parts
+
+
+def next_part_index(output, parts):
+    # Parts written but never recorded in the manifest (crash in between)
+    # are dropped; their files are still pending and get ingested again
+    indices = [-1]
+    for name in os.listdir(output):
+        if name.startswith("part-") and name.endswith((".parquet", ".tmp")):
+            if name in parts:
+                indices.append(int(name[5:10]))
+            else:
+                os.remove(os.path.join(output, name))
+    return max(indices) + 1
+
+
+# ---------------- PARSE STAGE (WORKER PROCESSES) ----------------
+def _init_worker():
+    # One thread per parse worker; the encoder owns the remaining cores
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = "1"
+    import document_parser
+    document_parser.PDF_WORKERS = 1
+
+
+def parse_file(path, key):
+    from updated_utils import extract_text_from_pdf, extract_text_from_docx, clean_text, split_sentences, extract_skill_phrases
+
+    try:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+            text = extract_text_from_pdf(f) if path.lower().endswith(".pdf") else extract_text_from_docx(f)
+        clean = clean_text(text)
+        return {
+            "key": key,
+            "path": path,
+            "digest": digest,
+            "text": text,
+            "sentences": split_sentences(clean),
+            "skills": sorted(extract_skill_phrases(clean)),
+        }
+    except Exception as e:
+        return {"key": key, "path": path, "error": f"{type(e).__name__}: {e}"}
+
+
+# ---------------- STORE ----------------
+def write_part(output, index, docs, embeddings, dim):
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    offsets = [0]
+    for doc in docs:
+        offsets.append(offsets[-1] + len(doc["sentences"]))
+
+    flat = np.concatenate(embeddings) if embeddings else np.zeros((0, dim), dtype=np.float32)
+    vectors = pa.FixedSizeListArray.from_arrays(pa.array(flat.reshape(-1), pa.float32()), dim)
+
+    table = pa.table({
+        "path": [d["path"] for d in docs],
+        "digest": [d["digest"] for d in docs],
+        "text": [d["text"] for d in docs],
+        "sentences": pa.array([d["sentences"] for d in docs], pa.list_(pa.string())),
+        "skills": pa.array([d["skills"] for d in docs], pa.list_(pa.string())),
+        "sentence_embeddings": pa.ListArray.from_arrays(pa.array(offsets, pa.int32()), vectors),
+    })
+
+    name = f"part-{index:05d}.parquet"
+    tmp = os.path.join(output, name + ".tmp")
+    pq.write_table(table, tmp)
+    os.replace(tmp, os.path.join(output, name))
+    return name
+
+
+def append_manifest(output, entries):
+    with open(os.path.join(output, MANIFEST_FILE), "a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+# ---------------- PIPELINE ----------------
+def run(source, output, workers, encode_batch_size, queue_size, part_size):
+    os.makedirs(output, exist_ok=True)
+    done, parts = load_manifest(output)
+    pending = [(p, k) for p, k in ((p, file_key(p)) for p in discover(source)) if k not in done]
+    print(f"{len(pending)} files to ingest ({len(done)} already in manifest)")
+    if not pending:
+        return
+
+    import numpy as np
+    import torch
+    from models import get_sentence_model
+
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) - workers))
+    model = get_sentence_model()
+    dim = model.get_sentence_embedding_dimension()
+
+    parsed = queue.Queue(maxsize=queue_size)
+    in_flight = threading.Semaphore(queue_size)
+    stop = object()
+
+    pool_errors = []
+
+    def deliver(future, path, key):
+        try:
+            parsed.put(future.result())
+        except BrokenProcessPool as e:
+            # Collateral of a dead worker, not this file's fault: kept out of
+            # the manifest so the next run retries it
+            parsed.put({"key": key, "path": path, "error": f"{type(e).__name__}: {e}", "retry": True})
+        except Exception as e:
+            parsed.put({"key": key, "path": path, "error": f"{type(e).__name__}: {e}"})
+
+    def produce():
+        # Keeps at most queue_size parse results buffered or in flight. A
+        # broken pool (e.g. a worker OOM-killed on a huge PDF) makes submit
+        # raise; stop is still queued so the encoder loop drains and exits
+        try:
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker) as pool:
+                for path, key in pending:
+                    in_flight.acquire()
+                    future = pool.submit(parse_file, path, key)
+                    future.add_done_callback(lambda fut, path=path, key=key: deliver(fut, path, key))
+        except Exception as e:
+            pool_errors.append(f"{type(e).__name__}: {e}")
+        finally:
+            parsed.put(stop)
+
+    producer = threading.Thread(target=produce, name="ingest-parse", daemon=True)
+    producer.start()
+
+    part_index = next_part_index(output, parts)
+    part_docs, part_embeddings, batch = [], [], []
+    processed, failed = 0, 0
+    start = time.perf_counter()
+
+    def encode_batch():
+        flat = [s for doc in batch for s in doc["sentences"]]
+        vectors = model.encode(flat, batch_size=encode_batch_size, convert_to_numpy=True) if flat else None
+        offset = 0
+        for doc in batch:
+            n = len(doc["sentences"])
+            part_embeddings.append(vectors[offset:offset + n].astype(np.float32) if n else np.zeros((0, dim), dtype=np.float32))
+            part_docs.append(doc)
+            offset += n
+        batch.clear()
+
+    def flush_part():
+        nonlocal part_index
+        name = write_part(output, part_index, part_docs, part_embeddings, dim)
+        append_manifest(output, [{"key": d["key"], "path": d["path"], "status": "ok", "part": name} for d in part_docs])
+        part_index += 1
+        part_docs.clear()
+        part_embeddings.clear()
+
+    while True:
+        doc = parsed.get()
+        if doc is stop:
+            break
+        in_flight.release()
+
+        if "error" in doc:
+            failed += 1
+            if doc.get("retry"):
+                continue
+            append_manifest(output, [{"key": doc["key"], "path": doc["path"], "status": "error", "error": doc["error"]}])
+            continue
+
+        batch.append(doc)
+        if sum(len(d["sentences"]) for d in batch) >= encode_batch_size:
+            encode_batch()
+        if len(part_docs) >= part_size:
+            flush_part()
+
+        processed += 1
+        if processed % 100 == 0:
+            elapsed = time.perf_counter() - start
+            print(f"  {processed}/{len(pending)} files  {processed / elapsed:.1f} files/sec")
+
+    if batch:
+        encode_batch()
+    if part_docs:
+        flush_part()
+
+    elapsed = time.perf_counter() - start
+    print(f"ingested {processed} files ({failed} failed) in {elapsed:.1f}s: {processed / max(elapsed, 1e-9):.1f} files/sec")
+    if pool_errors:
+        print(f"parse pool failed ({pool_errors[0]}); files not in the manifest are retried on the next run",
+              file=sys.stderr)
+        return 1
+
+
+def main(argv=None):
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Parse and embed a folder of resumes into a parquet store.")
+    parser.add_argument("source", help="folder containing .pdf/.docx resumes (searched recursively)")
+    parser.add_argument("output", help="store directory (parquet parts + manifest.jsonl)")
+    parser.add_argument("--workers", type=int, default=max(1, cpus // 2), help="parse processes")
+    parser.add_argument("--encode-batch-size", type=int, default=256, help="sentences per encoder call")
+    parser.add_argument("--queue-size", type=int, default=64, help="max parsed documents waiting for the encoder")
+    parser.add_argument("--part-size", type=int, default=500, help="documents per parquet part")
+    args = parser.parse_args(argv)
+
+    return run(args.source, args.output, args.workers, args.encode_batch_size, args.queue_size, args.part_size)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
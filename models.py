@@ -0,0 +1,153 @@
+import os
+import time
+import threading
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+SPACY_MODEL = "en_core_web_sm"
+
+# Encoder backend: torch (default), int8 or onnx (see encoders.py)
+ENCODER_BACKEND = os.environ.get("SKILLSYNC_ENCODER", "torch")
+ONNX_MODEL_DIR = os.environ.get("SKILLSYNC_ONNX_DIR")
+# Embeddings from different backends differ slightly, so they are cached apart
+ENCODER_KEY = MODEL_NAME if ENCODER_BACKEND == "torch" else f"{MODEL_NAME}:{ENCODER_BACKEND}"
+# Coalesce encode calls from concurrent sessions (see encoding_service.py)
+MICRO_BATCHING = os.environ.get("SKILLSYNC_MICROBATCH", "1") != "0"
+
+# ---------------- REGISTRY ----------------
+# Every model is constructed lazily, exactly once per process, and shared by
+# all callers (Streamlit sessions, batch jobs). app.py additionally wraps
+# warm_up_async() in st.cache_resource so reruns never touch the loaders.
+
+_registry = {}
+_load_times = {}
+# Re-entrant: a factory may pull in another registry entry (service -> model)
+_lock = threading.RLock()
+
+
+def _get(name, factory):
+    instance = _registry.get(name)
+    if instance is not None:
+        return instance
+
+    with _lock:
+        instance = _registry.get(name)
+        if instance is None:
+            start = time.perf_counter()
+            instance = factory()
+            _load_times[name] = time.perf_counter() - start
+            _registry[name] = instance
+    return instance
+
+
+def _load_nlp():
+    import spacy
+
+    nlp = spacy.load(SPACY_MODEL)
+    if "entity_ruler" not in nlp.pipe_names:
+        ruler = nlp.add_pipe("entity_ruler", before="ner")
+        taxonomy = get_skill_taxonomy()
+        ruler.add_patterns(taxonomy.token_patterns() + taxonomy.phrase_patterns())
+    return nlp
+
+
+def _load_skill_taxonomy():
+    from skill_taxonomy import build_taxonomy
+
+    return build_taxonomy()
+
+
+def _load_skill_matcher():
+    from skill_matcher import build_skill_matcher
+
+    return build_skill_matcher(get_skill_taxonomy())
+
+
+def _load_sentence_model():
+    from encoders import load_encoder
+
+    return load_encoder(ENCODER_BACKEND, MODEL_NAME, ONNX_MODEL_DIR)
+
+
+def _load_encoding_service():
+    from encoding_service import EncodingService
+
+    return EncodingService(get_sentence_model())
+
+
+def _load_skill_vectors():
+    return get_skill_taxonomy().load_embeddings(ENCODER_KEY, get_encoder())
+
+
+def _load_nltk_data():
+    import nltk
+
+    for resource, package in [("tokenizers/punkt", "punkt"), ("tokenizers/punkt_tab", "punkt_tab")]:
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package)
+    return True
+
+
+def get_nlp():
+    return _get("spacy", _load_nlp)
+
+
+def get_skill_taxonomy():
+    return _get("skill_taxonomy", _load_skill_taxonomy)
+
+
+def get_skill_vectors():
+    # (n_skills, dim) phrase embeddings of the taxonomy, indexed by skill id
+    return _get("skill_vectors", _load_skill_vectors)
+
+
+def get_skill_matcher():
+    return _get("skill_matcher", _load_skill_matcher)
+
+
+def get_sentence_model():
+    return _get("sentence_transformer", _load_sentence_model)
+
+
+def get_encoder():
+    # What the engine encodes through: the shared micro-batching service, or
+    # the model itself when micro-batching is disabled
+    if MICRO_BATCHING:
+        return _get("encoding_service", _load_encoding_service)
+    return get_sentence_model()
+
+
+def ensure_nltk_data():
+    return _get("nltk_data", _load_nltk_data)
+
+
+def warm_up():
+    ensure_nltk_data()
+    get_skill_matcher()
+    get_encoder()
+    get_skill_vectors()
+    return load_times()
+
+
+_warmup_thread = None
+_warmup_lock = threading.Lock()
+
+
+def warm_up_async():
+    # Imports and model construction happen off the calling thread; callers
+    # that need a model before it is ready simply block on the registry lock
+    global _warmup_thread
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(target=warm_up, name="model-warmup", daemon=True)
+            _warmup_thread.start()
+    return _warmup_thread
+
+
+def load_times():
+    return dict(_load_times)
+
+
+def is_loaded(name):
+    return name in _registry
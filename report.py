@@ -0,0 +1,99 @@
+import io
+import os
+import zipfile
+from xml.sax.saxutils import escape
+
+from worker_pools import pool_map
+
+# PDF analysis reports rendered straight into memory. Stylesheet and table
+# style are built once per process; app.py only renders a report when the
+# download is actually requested. Shortlists are rendered in a worker pool
+# and bundled into one zip.
+
+# Smaller shortlists are rendered inline
+PARALLEL_REPORT_THRESHOLD = 8
+REPORT_WORKERS = min(4, os.cpu_count() or 1)
+
+_styles = None
+
+
+def _get_styles():
+    global _styles
+    if _styles is None:
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import TableStyle
+        from reportlab.lib import colors
+
+        sheet = getSampleStyleSheet()
+        _styles = {
+            "title": ParagraphStyle('TitleStyle', parent=sheet['Heading1'], alignment=1, fontSize=26, spaceAfter=30),
+            "heading": sheet['Heading2'],
+            "normal": sheet['Normal'],
+            "table": TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#4f46e5")),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('GRID', (0, 0), (-1, -1), 1, colors.lightgrey)
+            ]),
+        }
+    return _styles
+
+
+# ---------------- SINGLE REPORT ----------------
+def render_report(score, matched, missing, structure, candidate=None):
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem, Table
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+
+    styles = _get_styles()
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4)
+
+    content = []
+    content.append(Paragraph("SkillSync Pro Analysis Report", styles["title"]))
+    if candidate:
+        content.append(Paragraph(escape(candidate), styles["heading"]))
+    content.append(Spacer(1, 0.3 * inch))
+
+    data = [
+        ["Metric", "Value"],
+        ["Overall Match Score", f"{score}%"],
+        ["Predicted Domain", structure["domain"]],
+        ["Structural Health", f"{structure['health']}/{len(structure['checks'])}"]
+    ] + [[section, "Verified" if found else "Missing"] for section, found in structure["checks"].items()]
+    t = Table(data, colWidths=[2.5 * inch, 2.5 * inch])
+    t.setStyle(styles["table"])
+    content.append(t)
+    content.append(Spacer(1, 0.5 * inch))
+
+    content.append(Paragraph("Key Technical Assets Identified:", styles["heading"]))
+    matched_items = [ListItem(Paragraph(s, styles["normal"])) for s in matched]
+    content.append(ListFlowable(matched_items, bulletType='bullet'))
+
+    doc.build(content)
+    return buffer.getvalue()
+
+
+def _render_job(job):
+    return render_report(job["score"], job["matched"], job["missing"], job["structure"], job.get("candidate"))
+
+
+# ---------------- BATCH ----------------
+def render_reports(jobs, workers=None):
+    # jobs: dicts with score, matched, missing, structure and candidate;
+    # returns PDF bytes in the same order
+    workers = REPORT_WORKERS if workers is None else workers
+    if workers <= 1 or len(jobs) < PARALLEL_REPORT_THRESHOLD:
+        return [_render_job(job) for job in jobs]
+    return pool_map("report", workers, _render_job, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+
+
+def shortlist_zip(jobs, workers=None):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for rank, (job, pdf) in enumerate(zip(jobs, render_reports(jobs, workers)), 1):
+            name = os.path.splitext(os.path.basename(job.get("candidate") or "candidate"))[0]
+            archive.writestr(f"{rank:03d}_{name}.pdf", pdf)
+    return buffer.getvalue()
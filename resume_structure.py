@@ -0,0 +1,149 @@
+import re
+
+from models import get_skill_taxonomy
+
+# Resume layout and domain from a single tokenization pass:
+#   - section headings (a short line that is, or starts with, a known heading
+#     followed by ":") with the character span each section covers; lines
+#     are slices of the document's token stream, never tokenized again
+#   - domain prediction by weighted keyword counts over the token stream,
+#     matched on whole tokens so "go" or "node" no longer hit "google" or
+#     "nodemon"; keywords shared by several domains split their weight
+# The result is a plain dict the UI and the PDF report read from directly.
+
+# "/" separates tokens, so "aws/azure" counts both skills
+TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:[.\-][a-z0-9+#]+)*")
+# Tokens plus "\n" and ":" markers, which delimit lines and heading prefixes
+STREAM_RE = re.compile(TOKEN_RE.pattern + r"|[\n:]")
+
+# Report label -> headings that open that section
+SECTIONS = {
+    "Professional Summary": ["summary", "professional summary", "career summary", "objective",
+                             "career objective", "profile", "professional profile", "about me"],
+    "Academic History": ["education", "academic history", "academics", "academic background",
+                         "educational qualifications", "qualifications"],
+    "Project Portfolio": ["projects", "project", "academic projects", "personal projects", "key projects"],
+    "Work Experience": ["experience", "work experience", "professional experience", "employment",
+                        "employment history", "work history", "internships", "internship"],
+}
+# Headings that only end the previous section
+OTHER_HEADINGS = ["skills", "technical skills", "key skills", "certifications", "achievements",
+                  "awards", "publications", "languages", "interests", "hobbies", "references",
+                  "contact", "activities", "extracurricular activities"]
+
+MAX_HEADING_TOKENS = 4
+# Only lines this short are considered as headings
+MAX_HEADING_CHARS = 80
+DEFAULT_DOMAIN = "General Technology"
+
+
+def _tokens(text):
+    return tuple(TOKEN_RE.findall(text.lower()))
+
+
+_HEADINGS = {_tokens(name): None for name in OTHER_HEADINGS}
+_HEADINGS.update({_tokens(name): label for label, names in SECTIONS.items() for name in names})
+
+
+# ---------------- KEYWORD INDEX ----------------
+_keyword_index = None
+
+
+def _build_keyword_index():
+    # First token -> [(term tokens, skill id)], longest terms first; every
+    # domain keyword matches through its skill's canonical name and aliases
+    taxonomy = get_skill_taxonomy()
+    weights = {}
+    for domain in taxonomy.domain_names:
+        for skill_id in {taxonomy.ids[" ".join(kw.lower().split())] for kw in taxonomy.domain_keywords[domain]}:
+            weights.setdefault(skill_id, {})[domain] = 1.0
+
+    first = {}
+    for skill_id, domains in weights.items():
+        share = 1.0 / len(domains)
+        for domain in domains:
+            domains[domain] = share
+        for term in [taxonomy.names[skill_id]] + taxonomy.aliases(skill_id):
+            tokens = _tokens(term)
+            if tokens:
+                first.setdefault(tokens[0], []).append((tokens, skill_id))
+    for entries in first.values():
+        entries.sort(key=lambda e: -len(e[0]))
+    return first, weights, list(taxonomy.domain_names)
+
+
+def _keyword_lookup():
+    global _keyword_index
+    if _keyword_index is None:
+        _keyword_index = _build_keyword_index()
+    return _keyword_index
+
+
+# ---------------- ANALYSIS ----------------
+def _heading(line_stream):
+    # The whole line is a heading, or it opens with one followed by ":"
+    colons = line_stream.count(":")
+    if len(line_stream) - colons <= MAX_HEADING_TOKENS:
+        line_tokens = tuple(token for token in line_stream if token != ":") if colons else tuple(line_stream)
+        if line_tokens in _HEADINGS:
+            return line_tokens
+    if colons:
+        head = tuple(line_stream[:line_stream.index(":")])
+        if 0 < len(head) <= MAX_HEADING_TOKENS and head in _HEADINGS:
+            return head
+    return None
+
+
+def analyze_structure(raw_text):
+    first, weights, domains = _keyword_lookup()
+    text = raw_text.lower()
+
+    stream = STREAM_RE.findall(text)
+    stream.append("\n")
+    headings = []
+    offset = first_token = 0
+    for line in text.split("\n"):
+        end_token = stream.index("\n", first_token)
+        if line and len(line) <= MAX_HEADING_CHARS:
+            head = _heading(stream[first_token:end_token])
+            if head is not None:
+                headings.append((offset, _HEADINGS[head]))
+        offset += len(line) + 1
+        first_token = end_token + 1
+    tokens = [token for token in stream if token not in "\n:"]
+
+    sections = {}
+    for i, (start, label) in enumerate(headings):
+        end = headings[i + 1][0] if i + 1 < len(headings) else len(text)
+        if label is not None and label not in sections:
+            sections[label] = (start, end)
+
+    counts = {}
+    covered = 0
+    for i in [i for i, token in enumerate(tokens) if token in first]:
+        if i < covered:
+            continue
+        for term, skill_id in first[tokens[i]]:
+            if tuple(tokens[i:i + len(term)]) == term:
+                counts[skill_id] = counts.get(skill_id, 0) + 1
+                covered = i + len(term)
+                break
+
+    scores = {domain: 0.0 for domain in domains}
+    for skill_id, count in counts.items():
+        for domain, weight in weights[skill_id].items():
+            scores[domain] += count * weight
+
+    # Ties keep the taxonomy's domain order
+    best = max(domains, key=lambda d: scores[d], default=None)
+    checks = {label: label in sections for label in SECTIONS}
+    taxonomy = get_skill_taxonomy()
+    return {
+        "sections": sections,
+        "checks": checks,
+        "health": sum(checks.values()),
+        "domain": best if best is not None and scores[best] > 0 else DEFAULT_DOMAIN,
+        "domain_scores": scores,
+        "keyword_counts": {taxonomy.names[s]: c for s, c in sorted(counts.items(), key=lambda kv: -kv[1])},
+        "token_count": len(tokens),
+    }
@@ -0,0 +1,42 @@
+import numpy as np
+
+# Per-skill best match over a resume's sentences without the full
+# skills x sentences similarity matrix: sentence embeddings are streamed in
+# blocks through one fixed-size buffer and only a running maximum per skill
+# is kept, so peak memory depends on block_size, not on resume length.
+# Blocks are normalized in the buffer, so the input (a memmapped store, a
+# float16 array) is never copied whole.
+
+DEFAULT_BLOCK_SIZE = 256
+
+
+def normalize(vectors, dtype=np.float32, inplace=False):
+    # Unit length along the last axis; zero vectors stay zero. inplace
+    # rescales `vectors` itself (an array of the wanted dtype) without a copy
+    matrix = vectors if inplace else np.array(vectors, dtype=dtype)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    np.maximum(norms, 1e-12, out=norms)
+    matrix /= norms
+    return matrix
+
+
+def max_cosine(queries, keys, block_size=DEFAULT_BLOCK_SIZE, dtype=np.float32):
+    # -> (n_queries,) max cosine similarity of each query over all keys;
+    # dtype=np.float16 halves the buffer at some precision cost
+    queries = normalize(np.array(queries, dtype=dtype, ndmin=2), inplace=True)
+    best = np.full(len(queries), -np.inf, dtype=np.float32)
+    if len(keys) == 0:
+        return best
+
+    block_size = min(block_size, len(keys))
+    buffer = np.empty((block_size, queries.shape[1]), dtype=dtype)
+    sims = np.empty((len(queries), block_size), dtype=dtype)
+
+    for start in range(0, len(keys), block_size):
+        n = min(block_size, len(keys) - start)
+        block = buffer[:n]
+        block[...] = keys[start:start + n]
+        normalize(block, inplace=True)
+        np.matmul(queries, block.T, out=sims[:, :n])
+        np.maximum(best, sims[:, :n].max(axis=1), out=best)
+    return best
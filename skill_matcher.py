@@ -0,0 +1,50 @@
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc
+from spacy.util import filter_spans
+
+# Tokenizer-only replacement for the SKILL EntityRuler: every pattern is
+# compiled into one PhraseMatcher, and a whole document is tokenized and
+# matched in a single linear pass (no tagger, parser or NER).
+
+
+# ---------------- MATCHER ----------------
+class SkillMatcher:
+    def __init__(self, nlp=None):
+        if nlp is None:
+            import spacy
+            nlp = spacy.blank("en")
+        self.nlp = nlp
+        self.matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        self.size = 0
+
+    def add_token_patterns(self, patterns):
+        # EntityRuler-style {"pattern": [{"LOWER": ...}, ...]} entries; the
+        # pattern doc keeps exactly those tokens so matching is identical
+        docs = []
+        for entry in patterns:
+            words = [token["LOWER"] for token in entry["pattern"]]
+            docs.append(Doc(self.nlp.vocab, words=words, spaces=[True] * (len(words) - 1) + [False]))
+        self.matcher.add("SKILL", docs)
+        self.size += len(docs)
+
+    def add_phrases(self, phrases):
+        docs = list(self.nlp.tokenizer.pipe(phrases))
+        self.matcher.add("SKILL", docs)
+        self.size += len(docs)
+
+    def find(self, text):
+        doc = self.nlp.make_doc(text)
+        spans = [doc[start:end] for _, start, end in self.matcher(doc)]
+        # Same overlap resolution as the EntityRuler: longest, then earliest
+        return [(span.start_char, span.end_char, span.text.lower()) for span in filter_spans(spans)]
+
+    def extract(self, text):
+        # Distinct phrases in order of first occurrence (stable across runs)
+        return list(dict.fromkeys(phrase for _, _, phrase in self.find(text)))
+
+
+def build_skill_matcher(taxonomy):
+    matcher = SkillMatcher()
+    matcher.add_token_patterns(taxonomy.token_patterns())
+    matcher.add_phrases(taxonomy.phrase_names())
+    return matcher
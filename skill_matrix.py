@@ -0,0 +1,206 @@
+import os
+import sys
+import glob
+import argparse
+
+import numpy as np
+from scipy import sparse
+
+from similarity import normalize
+
+# Talent-pool scoring: every JD against every resume in a few matrix products.
+#
+#   resumes  -> CSR presence matrix R (n_resumes x n_skills) over the taxonomy
+#             + normalized document embeddings E (n_resumes x dim)
+#   JDs      -> CSR weight matrix W (n_jds x n_skills), importance per skill
+#             + normalized JD embeddings Q (n_jds x dim)
+#
+#   skill    = floor(100 * (R @ W.T) / W.sum(axis=1))
+#   semantic = E @ Q.T
+#   score    = min(100, floor(0.7 * skill + 30 * semantic))   (updated_utils weights)
+#
+# Resumes are streamed in row chunks and only a running top-k per JD is kept,
+# so memory is bounded by (k + chunk_size) x n_jds. A skill counts as present
+# when the taxonomy matcher tags it in the resume; the per-sentence semantic
+# skill match of score_resume is left to the re-scoring of a shortlist.
+
+SKILL_WEIGHT = 0.7
+SEMANTIC_WEIGHT = 30
+DEFAULT_CHUNK_SIZE = 8192
+
+
+class SkillMatrix:
+    def __init__(self, taxonomy=None):
+        if taxonomy is None:
+            from models import get_skill_taxonomy
+            taxonomy = get_skill_taxonomy()
+        self.taxonomy = taxonomy
+        self.candidates = []
+        self.presence = sparse.csr_matrix((0, len(taxonomy)), dtype=np.float32)
+        self.embeddings = None
+
+        self._indices = []
+        self._embedding_rows = []
+
+    def __len__(self):
+        return len(self.candidates)
+
+    # ---------- building ----------
+    def add(self, candidate, skills, doc_embedding):
+        ids = self.taxonomy.lookup(list(skills))
+        self._indices.append(np.unique(ids[ids >= 0]))
+        self._embedding_rows.append(np.asarray(doc_embedding, dtype=np.float32))
+        self.candidates.append(candidate)
+
+    def add_texts(self, resumes, batch_size=64):
+        # resumes: (candidate, raw_text) pairs; embedded in batches like screen_many
+        from updated_utils import clean_text, split_sentences, extract_skill_phrases, encode, document_embedding
+
+        resumes = list(resumes)
+        for start in range(0, len(resumes), batch_size):
+            chunk = resumes[start:start + batch_size]
+            cleaned = [clean_text(text) for _, text in chunk]
+            split = [split_sentences(text) or [text] for text in cleaned]
+            embeddings = encode([sent for sentences in split for sent in sentences])
+
+            offset = 0
+            for (candidate, _), resume_clean, sentences in zip(chunk, cleaned, split):
+                doc = document_embedding(sentences, embeddings[offset:offset + len(sentences)])
+                self.add(candidate, extract_skill_phrases(resume_clean), doc)
+                offset += len(sentences)
+        return self
+
+    def compile(self):
+        # Appends pending rows to the CSR matrix and the embedding block
+        if not self._indices:
+            return self
+        lengths = np.fromiter((len(i) for i in self._indices), dtype=np.int64, count=len(self._indices))
+        indptr = np.concatenate([[0], np.cumsum(lengths)])
+        indices = np.concatenate(self._indices) if indptr[-1] else np.zeros(0, dtype=np.int64)
+        rows = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(self._indices), len(self.taxonomy)),
+        )
+        block = normalize(np.stack(self._embedding_rows))
+
+        self.presence = sparse.vstack([self.presence, rows], format="csr")
+        self.embeddings = block if self.embeddings is None else np.concatenate([self.embeddings, block])
+        self._indices, self._embedding_rows = [], []
+        return self
+
+    @classmethod
+    def from_store(cls, directory, taxonomy=None):
+        # Parquet store written by ingest.py: skills and sentence embeddings
+        # are already there, nothing is parsed or encoded again
+        import pyarrow.parquet as pq
+        from updated_utils import document_embedding
+
+        matrix = cls(taxonomy)
+        for path in sorted(glob.glob(os.path.join(directory, "part-*.parquet"))):
+            table = pq.read_table(path, columns=["path", "sentences", "skills", "sentence_embeddings"])
+            columns = table.to_pydict()
+            for candidate, sentences, skills, vectors in zip(columns["path"], columns["sentences"],
+                                                             columns["skills"], columns["sentence_embeddings"]):
+                if not sentences:
+                    continue
+                matrix.add(candidate, skills, document_embedding(sentences, np.asarray(vectors, dtype=np.float32)))
+        return matrix.compile()
+
+    # ---------- queries ----------
+    def jd_matrix(self, jd_texts):
+        from updated_utils import build_jd_profile
+
+        entries, embeddings = {}, []
+        dim = self.embeddings.shape[1]
+        for row, jd_text in enumerate(jd_texts):
+            profile = build_jd_profile(jd_text)
+            phrases = list(profile["skills"])
+            for skill_id, phrase in zip(self.taxonomy.lookup(phrases), phrases):
+                if skill_id >= 0:
+                    key = (row, int(skill_id))
+                    entries[key] = max(entries.get(key, 0), profile["skills"][phrase])
+            embeddings.append(profile["embedding"] if profile["embedding"] is not None else np.zeros(dim))
+
+        keys = list(entries)
+        W = sparse.csr_matrix(
+            (np.array([entries[key] for key in keys], dtype=np.float32),
+             (np.array([key[0] for key in keys], dtype=np.int64), np.array([key[1] for key in keys], dtype=np.int64))),
+            shape=(len(jd_texts), len(self.taxonomy)),
+        )
+        return W, normalize(np.stack(embeddings)) if embeddings else np.zeros((0, dim), dtype=np.float32)
+
+    def score_block(self, start, stop, W, Q):
+        # (stop - start) x n_jds integer scores for a block of resumes
+        totals = np.asarray(W.sum(axis=1)).ravel()
+        # float64 so the floors agree with the scalar int() in score_resume
+        matched = (self.presence[start:stop] @ W.T).toarray().astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            skill = np.floor(np.where(totals > 0, matched / totals * 100, 0))
+        semantic = (self.embeddings[start:stop] @ Q.T).astype(np.float64)
+        scores = np.minimum(100, np.floor(skill * SKILL_WEIGHT + semantic * SEMANTIC_WEIGHT))
+        # A JD without known skills scores every resume 0, as in score_resume
+        scores[:, totals == 0] = 0
+        return scores.astype(np.int32)
+
+    def top_k(self, jd_texts, k=20, chunk_size=DEFAULT_CHUNK_SIZE):
+        # -> per JD, a list of (candidate, score) sorted best first
+        self.compile()
+        if not self.candidates:
+            return [[] for _ in jd_texts]
+        W, Q = self.jd_matrix(jd_texts)
+        return self.top_k_matrix(W, Q, k, chunk_size)
+
+    def top_k_matrix(self, W, Q, k=20, chunk_size=DEFAULT_CHUNK_SIZE):
+        n = len(self.candidates)
+        n_jds = W.shape[0]
+        k = min(k, n)
+        if not n_jds or not k:
+            return [[] for _ in range(n_jds)]
+
+        best_scores = np.full((0, n_jds), -1, dtype=np.int32)
+        best_rows = np.zeros((0, n_jds), dtype=np.int64)
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            scores = np.concatenate([best_scores, self.score_block(start, stop, W, Q)])
+            rows = np.concatenate([best_rows, np.broadcast_to(np.arange(start, stop)[:, None], (stop - start, n_jds))])
+            if len(scores) > k:
+                keep = np.argpartition(-scores, k - 1, axis=0)[:k]
+                scores = np.take_along_axis(scores, keep, axis=0)
+                rows = np.take_along_axis(rows, keep, axis=0)
+            best_scores, best_rows = scores, rows
+
+        order = np.argsort(-best_scores, axis=0, kind="stable")
+        best_scores = np.take_along_axis(best_scores, order, axis=0)
+        best_rows = np.take_along_axis(best_rows, order, axis=0)
+        return [
+            [(self.candidates[r], int(s)) for r, s in zip(best_rows[:, j], best_scores[:, j])]
+            for j in range(n_jds)
+        ]
+
+    def skills_of(self, candidate_row):
+        start, end = self.presence.indptr[candidate_row], self.presence.indptr[candidate_row + 1]
+        return [self.taxonomy.names[i] for i in self.presence.indices[start:end]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score every JD against every resume in an ingest store.")
+    parser.add_argument("store", help="directory written by ingest.py")
+    parser.add_argument("jds", nargs="+", help="JD text files")
+    parser.add_argument("--k", type=int, default=20, help="candidates kept per JD")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="resumes scored per block")
+    args = parser.parse_args(argv)
+
+    matrix = SkillMatrix.from_store(args.store)
+    jd_texts = []
+    for path in args.jds:
+        with open(path, "r", encoding="utf-8") as f:
+            jd_texts.append(f.read())
+
+    for path, ranked in zip(args.jds, matrix.top_k(jd_texts, k=args.k, chunk_size=args.chunk_size)):
+        print(f"== {path}")
+        for rank, (candidate, score) in enumerate(ranked, 1):
+            print(f"{rank:4d}  {score:3d}  {candidate}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+import os
+import sys
+import json
+import hashlib
+
+import numpy as np
+
+# One source of truth for skill knowledge, compiled once per process:
+#
+#   skill id -> canonical name, aliases, domains, phrase embedding
+#
+# data/skills.json lists the skills (plus aliases and whether the skill
+# matcher should tag them) and the keywords of each app domain. Phrase
+# embeddings for every canonical name live in a single float32 array per
+# encoder, computed once and memory-mapped afterwards, so scoring looks
+# skill vectors up by id instead of encoding phrases per request.
+#
+#   python skill_taxonomy.py build   # precompute embeddings for the encoder
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skills.json")
+DEFAULT_VECTOR_DIR = os.environ.get(
+    "SKILLSYNC_SKILL_VECTORS",
+    os.path.join(os.path.expanduser("~"), ".cache", "skillsync", "skills")
+)
+
+
+def _term(text):
+    return " ".join(text.lower().split())
+
+
+# ---------------- INDEX ----------------
+class SkillTaxonomy:
+    def __init__(self):
+        self.names = []
+        self.groups = []
+        self.ids = {}
+        self._extract = []
+        self._legacy = []
+        self._alias_terms = []
+        self._alias_offsets = [0]
+
+        self.domain_names = []
+        self.domain_keywords = {}
+        self._skill_domains = {}
+
+        self.vectors = None
+        self.vector_key = None
+
+    def __len__(self):
+        return len(self.names)
+
+    # ---------- loading ----------
+    def add(self, name, aliases=(), group=None, extract=True, legacy=False):
+        term = _term(name)
+        skill_id = self.ids.get(term)
+        if skill_id is not None:
+            return skill_id
+
+        skill_id = len(self.names)
+        self.names.append(term)
+        self.groups.append(group)
+        self._extract.append(extract)
+        self._legacy.append(legacy)
+        self.ids[term] = skill_id
+        for alias in aliases:
+            self._alias_terms.append(alias.lower())
+            self.ids.setdefault(_term(alias), skill_id)
+        self._alias_offsets.append(len(self._alias_terms))
+        self.vectors = None
+        return skill_id
+
+    def add_domain(self, domain, keywords):
+        if domain not in self.domain_keywords:
+            self.domain_names.append(domain)
+            self.domain_keywords[domain] = []
+        self.domain_keywords[domain].extend(keywords)
+        for keyword in keywords:
+            skill_id = self.ids.get(_term(keyword))
+            if skill_id is None:
+                raise ValueError(f"Domain {domain!r} keyword {keyword!r} is not in the taxonomy")
+            self._skill_domains.setdefault(skill_id, []).append(domain)
+
+    def load(self, path, legacy=False):
+        # Taxonomy JSON ({"skills": [...], "domains": {...}}) or a plain skill
+        # list: JSON list of names, or one name per line. legacy marks the
+        # built-in set that keeps the old hand-written token patterns
+        domains = {}
+        with open(path, "r", encoding="utf-8") as f:
+            if path.endswith(".json"):
+                data = json.load(f)
+                entries = data["skills"] if isinstance(data, dict) else data
+                domains = data.get("domains", {}) if isinstance(data, dict) else {}
+            else:
+                entries = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+        for entry in entries:
+            if isinstance(entry, str):
+                self.add(entry, legacy=legacy)
+            else:
+                self.add(entry["name"], entry.get("aliases", ()), entry.get("group"), entry.get("extract", True), legacy)
+        for domain, keywords in domains.items():
+            self.add_domain(domain, keywords)
+        return self
+
+    # ---------- lookups ----------
+    def lookup(self, phrases):
+        # Skill id per phrase (canonical name or alias), -1 when unknown
+        return np.fromiter((self.ids.get(_term(p), -1) for p in phrases), dtype=np.int64, count=len(phrases))
+
+    def aliases(self, skill_id):
+        return self._alias_terms[self._alias_offsets[skill_id]:self._alias_offsets[skill_id + 1]]
+
+    def domains(self, skill_id):
+        return self._skill_domains.get(skill_id, [])
+
+    def extractable(self):
+        return [name for name, extract in zip(self.names, self._extract) if extract]
+
+    def token_patterns(self):
+        # Hand-written EntityRuler patterns, built-in skills only: splitting on
+        # spaces never matches names the tokenizer splits ("ci/cd", "ms-excel")
+        return [
+            {"label": "SKILL", "pattern": [{"LOWER": word} for word in name.split(" ")]}
+            for name, extract, legacy in zip(self.names, self._extract, self._legacy) if extract and legacy
+        ]
+
+    def phrase_names(self):
+        # Every other skill the matcher tags, tokenized by spaCy itself
+        return [name for name, extract, legacy in zip(self.names, self._extract, self._legacy) if extract and not legacy]
+
+    def phrase_patterns(self):
+        return [{"label": "SKILL", "pattern": name} for name in self.phrase_names()]
+
+    def alias_table(self):
+        # canonical name -> aliases, the table utils.normalize_aliases compiles
+        return {name: self.aliases(i) for i, name in enumerate(self.names) if self.aliases(i)}
+
+    # ---------- embeddings ----------
+    def _vector_path(self, encoder_key, directory):
+        digest = hashlib.sha1("\n".join([encoder_key] + self.names).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(directory, f"skills-{digest}.npy")
+
+    def load_embeddings(self, encoder_key, encoder, directory=None, batch_size=256):
+        # One (n_skills, dim) float32 array per encoder and taxonomy content
+        if self.vectors is not None and self.vector_key == encoder_key:
+            return self.vectors
+
+        path = self._vector_path(encoder_key, directory or DEFAULT_VECTOR_DIR)
+        if os.path.exists(path):
+            vectors = np.load(path, mmap_mode="r")
+        else:
+            vectors = np.asarray(encoder.encode(self.names, batch_size=batch_size, convert_to_numpy=True), dtype=np.float32)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = path + ".tmp"
+                with open(tmp, "wb") as f:
+                    np.save(f, vectors)
+                os.replace(tmp, path)
+            except OSError:
+                # Read-only cache dir: keep the in-memory copy for this process
+                pass
+
+        self.vectors = vectors
+        self.vector_key = encoder_key
+        return vectors
+
+    def phrase_vectors(self, phrases, encode_missing):
+        # Stored vectors for known skills; anything else goes to the encoder
+        ids = self.lookup(phrases)
+        vectors = np.empty((len(phrases), self.vectors.shape[1]), dtype=np.float32)
+        known = ids >= 0
+        vectors[known] = self.vectors[ids[known]]
+        if not known.all():
+            missing = np.flatnonzero(~known)
+            vectors[missing] = encode_missing([phrases[i] for i in missing])
+        return vectors
+
+
+def build_taxonomy(path=None, extra_path=None):
+    taxonomy = SkillTaxonomy().load(path or DEFAULT_TAXONOMY_PATH, legacy=path is None)
+    extra_path = extra_path or os.environ.get("SKILLSYNC_SKILL_TAXONOMY")
+    if extra_path:
+        taxonomy.load(extra_path)
+    return taxonomy
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile the skill taxonomy and precompute its embeddings.")
+    parser.add_argument("command", choices=["build", "stats"])
+    args = parser.parse_args(argv)
+
+    import models
+
+    taxonomy = models.get_skill_taxonomy()
+    print(f"{len(taxonomy)} skills, {len(taxonomy.ids)} terms, {len(taxonomy.domain_names)} domains")
+    if args.command == "build":
+        vectors = models.get_skill_vectors()
+        print(f"embeddings {vectors.shape} for {models.ENCODER_KEY}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+import torch
+from sentence_transformers import util
+
+from similarity import max_cosine, normalize
+
+TOLERANCE = {np.float32: 1e-5, np.float16: 5e-3}
+
+
+def reference(queries, keys):
+    return util.cos_sim(torch.from_numpy(queries), torch.from_numpy(keys)).max(dim=1).values.numpy()
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    queries = rng.standard_normal((17, 32)).astype(np.float32)
+    keys = rng.standard_normal((1000, 32)).astype(np.float32)
+    # Near-duplicates so some maxima are close to 1, like real skill matches
+    keys[[3, 500, 999]] = queries[:3] + 0.05
+    return queries, keys
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float16])
+@pytest.mark.parametrize("block_size", [1, 7, 256, 999, 1000, 4096])
+def test_matches_full_matrix(data, dtype, block_size):
+    queries, keys = data
+    got = max_cosine(queries, keys, block_size, dtype)
+    assert got.shape == (len(queries),)
+    np.testing.assert_allclose(got, reference(queries, keys), atol=TOLERANCE[dtype])
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float16])
+def test_single_key(data, dtype):
+    queries, keys = data
+    np.testing.assert_allclose(max_cosine(queries, keys[:1], dtype=dtype), reference(queries, keys[:1]),
+                               atol=TOLERANCE[dtype])
+
+
+def test_no_keys(data):
+    queries, _ = data
+    got = max_cosine(queries, np.zeros((0, queries.shape[1]), dtype=np.float32))
+    assert got.shape == (len(queries),)
+    assert np.all(got == -np.inf)
+
+
+def test_single_query_vector(data):
+    queries, keys = data
+    np.testing.assert_allclose(max_cosine(queries[0], keys), reference(queries[:1], keys), atol=1e-5)
+
+
+def test_keys_not_modified(data):
+    queries, keys = data
+    before = keys.copy()
+    max_cosine(queries, keys, block_size=64)
+    np.testing.assert_array_equal(keys, before)
+
+
+def test_normalize():
+    vectors = np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32)
+    np.testing.assert_allclose(normalize(vectors), [[0.6, 0.8], [0.0, 0.0]])
+    assert vectors[0, 0] == 3.0
+    normalize(vectors, inplace=True)
+    np.testing.assert_allclose(vectors, [[0.6, 0.8], [0.0, 0.0]])
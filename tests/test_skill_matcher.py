@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("spacy")
+
+from skill_matcher import build_skill_matcher
+from skill_taxonomy import build_taxonomy
+
+
+@pytest.fixture(scope="module")
+def taxonomy():
+    taxonomy = build_taxonomy()
+    taxonomy.add("ci/cd")
+    taxonomy.add("MS-Excel")
+    taxonomy.add("dashboards", extract=False)
+    return taxonomy
+
+
+def test_punctuated_skills_match(taxonomy):
+    matcher = build_skill_matcher(taxonomy)
+    found = matcher.extract("built ci/cd pipelines in python and reported in ms-excel dashboards")
+    assert found == ["ci/cd", "python", "ms-excel"]
+
+
+def test_builtin_skills_keep_token_patterns(taxonomy):
+    legacy = {" ".join(token["LOWER"] for token in entry["pattern"]) for entry in taxonomy.token_patterns()}
+    assert "python" in legacy and "machine learning" in legacy
+    assert "ci/cd" not in legacy
+    assert taxonomy.phrase_names() == ["ci/cd", "ms-excel"]
@@ -0,0 +1,136 @@
+import os
+import sys
+import tempfile
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+# Corpus-level TF-IDF for utils.calculate_match_score. Terms are hashed into a
+# fixed feature space, so the "vocabulary" never has to be refit: the model
+# is just document frequencies + a document count, updated incrementally and
+# persisted as a small .npz. Scoring only transforms and does sparse dot
+# products, for any number of resumes against one JD in a single multiply.
+
+DEFAULT_MODEL_PATH = os.environ.get(
+    "SKILLSYNC_TFIDF_MODEL",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "tfidf_model.npz")
+)
+N_FEATURES = 2 ** 18
+
+
+class CorpusTfidf:
+    def __init__(self, n_features=N_FEATURES):
+        self.n_features = n_features
+        # Same tokenization as TfidfVectorizer's defaults
+        self.hasher = HashingVectorizer(n_features=n_features, alternate_sign=False, norm=None)
+        self.df = np.zeros(n_features, dtype=np.int64)
+        self.n_docs = 0
+        self._idf = None
+
+    # ---------- fitting ----------
+    def partial_fit(self, texts):
+        counts = self.hasher.transform(texts)
+        counts.data[:] = 1
+        self.df += np.asarray(counts.sum(axis=0)).ravel().astype(np.int64)
+        self.n_docs += counts.shape[0]
+        self._idf = None
+        return self
+
+    def fit(self, texts):
+        self.df[:] = 0
+        self.n_docs = 0
+        return self.partial_fit(texts)
+
+    @property
+    def idf(self):
+        if self._idf is None:
+            # Smoothed IDF, as in sklearn's TfidfTransformer
+            self._idf = (np.log((1 + self.n_docs) / (1 + self.df)) + 1).astype(np.float64)
+        return self._idf
+
+    # ---------- scoring ----------
+    def transform(self, texts):
+        vectors = self.hasher.transform(texts)
+        vectors = vectors.multiply(self.idf).tocsr()
+        return normalize(vectors)
+
+    def similarities(self, resumes, jd):
+        # Rows are L2-normalized, so one sparse product gives every cosine
+        jd_vector = self.transform([jd])
+        return np.asarray((self.transform(resumes) @ jd_vector.T).todense()).ravel()
+
+    # ---------- persistence ----------
+    def save(self, path=DEFAULT_MODEL_PATH):
+        # Written next to the target and swapped in: a scoring call that sees
+        # the new mtime never reads a half-written zip
+        path = _npz_path(path)
+        nonzero = np.flatnonzero(self.df)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as f:
+            np.savez_compressed(f, n_features=self.n_features, n_docs=self.n_docs,
+                                df_index=nonzero, df_value=self.df[nonzero])
+        try:
+            os.replace(f.name, path)
+        except OSError:
+            os.remove(f.name)
+            raise
+
+    @classmethod
+    def load(cls, path=DEFAULT_MODEL_PATH):
+        with np.load(_npz_path(path)) as data:
+            model = cls(int(data["n_features"]))
+            model.df[data["df_index"]] = data["df_value"]
+            model.n_docs = int(data["n_docs"])
+        return model
+
+
+_loaded = {}
+
+
+def _npz_path(path):
+    # np.savez appends .npz to bare paths; do it up front so save, load and
+    # the reload check all agree on one file
+    return path if path.endswith(".npz") else path + ".npz"
+
+
+def get_tfidf_model(path=DEFAULT_MODEL_PATH):
+    # None until a corpus model has been fitted; loaded once per fit, so a
+    # model fitted or refitted while the app runs is picked up without a restart
+    path = _npz_path(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _loaded.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _loaded[path] = (mtime, CorpusTfidf.load(path))
+    return cached[1]
+
+
+def fit_from_folder(source, path=DEFAULT_MODEL_PATH, batch_size=500):
+    import utils
+
+    model = CorpusTfidf.load(path) if os.path.exists(_npz_path(path)) else CorpusTfidf()
+    batch = []
+    for root, _, files in os.walk(source):
+        for name in sorted(files):
+            if not name.lower().endswith((".pdf", ".docx")):
+                continue
+            with open(os.path.join(root, name), "rb") as f:
+                text = utils.extract_text_from_pdf(f) if name.lower().endswith(".pdf") else utils.extract_text_from_docx(f)
+            batch.append(utils.normalize_aliases(utils.clean_text(text)))
+            if len(batch) >= batch_size:
+                model.partial_fit(batch)
+                batch = []
+    if batch:
+        model.partial_fit(batch)
+    model.save(path)
+    return model
+
+
+if __name__ == "__main__":
+    # python tfidf_model.py <resume folder> [model.npz]
+    fitted = fit_from_folder(sys.argv[1], *sys.argv[2:3])
+    print(f"fitted on {fitted.n_docs} documents, {np.count_nonzero(fitted.df)} hashed terms")
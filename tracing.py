@@ -0,0 +1,167 @@
+import os
+import json
+import time
+import bisect
+import threading
+import functools
+from collections import deque
+from contextlib import contextmanager
+
+# Lightweight stage tracing for the scoring engine. A span costs two
+# perf_counter calls and a locked append; percentiles come from a bounded
+# reservoir of recent samples and cumulative buckets back the Prometheus
+# export. Set SKILLSYNC_TRACING=0 to turn spans into no-ops.
+
+ENABLED = os.environ.get("SKILLSYNC_TRACING", "1") != "0"
+RESERVOIR_SIZE = 2048
+TRACE_HISTORY = 50
+BUCKETS_MS = [1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+# ---------------- HISTOGRAM ----------------
+class Histogram:
+    def __init__(self):
+        self.samples = deque(maxlen=RESERVOIR_SIZE)
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, ms):
+        self.samples.append(ms)
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+
+    def percentile(self, q):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
+_histograms = {}
+_traces = deque(maxlen=TRACE_HISTORY)
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _record(name, ms):
+    with _lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = Histogram()
+        hist.observe(ms)
+    current = getattr(_local, "trace", None)
+    if current is not None:
+        current["spans"].append((name, ms))
+
+
+# ---------------- SPANS ----------------
+@contextmanager
+def span(name):
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, (time.perf_counter() - start) * 1000)
+
+
+def traced(name):
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def trace(label):
+    # Collects every span on this thread into one per-analysis breakdown
+    current = {"label": label, "started": time.time(), "spans": []}
+    previous = getattr(_local, "trace", None)
+    _local.trace = current
+    start = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current["total_ms"] = (time.perf_counter() - start) * 1000
+        _local.trace = previous
+        with _lock:
+            _traces.append(current)
+        _record(f"{label}.total", current["total_ms"])
+
+
+# ---------------- EXPORT ----------------
+def breakdown(entry):
+    stages = {}
+    for name, ms in entry["spans"]:
+        stages[name] = stages.get(name, 0.0) + ms
+    return stages
+
+
+def recent_traces(n=TRACE_HISTORY):
+    with _lock:
+        return list(_traces)[-n:]
+
+
+def summaries():
+    with _lock:
+        return {name: hist.summary() for name, hist in sorted(_histograms.items())}
+
+
+def export_json():
+    return json.dumps({
+        "stages": summaries(),
+        "traces": [
+            {"label": t["label"], "started": t["started"], "total_ms": t["total_ms"], "stages": breakdown(t)}
+            for t in recent_traces()
+        ],
+    }, indent=2)
+
+
+def export_prometheus():
+    lines = [
+        "# HELP skillsync_stage_duration_ms Scoring engine stage latency in milliseconds.",
+        "# TYPE skillsync_stage_duration_ms histogram",
+    ]
+    with _lock:
+        items = sorted(_histograms.items())
+        for name, hist in items:
+            cumulative = 0
+            for bound, count in zip(BUCKETS_MS + ["+Inf"], hist.buckets):
+                cumulative += count
+                lines.append(f'skillsync_stage_duration_ms_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'skillsync_stage_duration_ms_sum{{stage="{name}"}} {hist.total_ms:.3f}')
+            lines.append(f'skillsync_stage_duration_ms_count{{stage="{name}"}} {hist.count}')
+
+    lines.append("# HELP skillsync_stage_duration_ms_quantile Recent-sample quantiles in milliseconds.")
+    lines.append("# TYPE skillsync_stage_duration_ms_quantile gauge")
+    for name, summary in summaries().items():
+        for q in ("p50", "p95", "p99"):
+            lines.append(f'skillsync_stage_duration_ms_quantile{{stage="{name}",quantile="{q}"}} {summary[q + "_ms"]:.3f}')
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+        _traces.clear()
@@ -1,106 +1,19 @@
-import fitz
-import docx
+import io
 import re
-import spacy
+from bisect import bisect_right
 import nltk
-from sentence_transformers import SentenceTransformer, util
+import numpy as np
+import pandas as pd
+from embedding_cache import EmbeddingCache
+from document_cache import DocumentCache
+from document_parser import extract_pdf_text, iter_docx_paragraphs, read_upload
+from tracing import traced, span
+from similarity import max_cosine
+from models import ENCODER_KEY, get_skill_matcher, get_skill_taxonomy, get_skill_vectors, get_encoder, ensure_nltk_data
 
 # ---------------- MODELS ----------------
-nlp = spacy.load("en_core_web_sm")
-
-# ---------------- ENTITY RULER (EXPANDED SKILLS) ----------------
-if "entity_ruler" not in nlp.pipe_names:
-    ruler = nlp.add_pipe("entity_ruler", before="ner")
-
-    patterns = [
-
-        # ---------- PROGRAMMING ----------
-        {"label": "SKILL", "pattern": [{"LOWER": "python"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "java"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "c++"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "c#"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "javascript"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "typescript"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "go"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "ruby"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "php"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "swift"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "kotlin"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "rust"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "nodejs"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "express"}]},
-
-        # ---------- DATA ----------
-        {"label": "SKILL", "pattern": [{"LOWER": "machine"}, {"LOWER": "learning"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "deep"}, {"LOWER": "learning"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "data"}, {"LOWER": "analysis"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "data"}, {"LOWER": "science"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "sql"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "mysql"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "postgresql"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "mongodb"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "pandas"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "numpy"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "tensorflow"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "pytorch"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "scikit-learn"}]},
-
-        # ---------- CLOUD & DEVOPS ----------
-        {"label": "SKILL", "pattern": [{"LOWER": "docker"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "kubernetes"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "aws"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "azure"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "gcp"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "devops"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "git"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "jenkins"}]},
-
-        # ---------- FRONTEND ----------
-        {"label": "SKILL", "pattern": [{"LOWER": "react"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "angular"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "vue"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "html"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "css"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "bootstrap"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "tailwind"}]},
-
-        # ---------- BUSINESS ----------
-        {"label": "SKILL", "pattern": [{"LOWER": "project"}, {"LOWER": "management"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "leadership"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "communication"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "teamwork"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "financial"}, {"LOWER": "analysis"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "accounting"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "excel"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "powerpoint"}]},
-
-        # ---------- MARKETING ----------
-        {"label": "SKILL", "pattern": [{"LOWER": "seo"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "digital"}, {"LOWER": "marketing"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "content"}, {"LOWER": "marketing"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "branding"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "google"}, {"LOWER": "analytics"}]},
-
-        # ---------- HR ----------
-        {"label": "SKILL", "pattern": [{"LOWER": "recruitment"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "talent"}, {"LOWER": "acquisition"}]},
-        {"label": "SKILL", "pattern": [{"LOWER": "employee"}, {"LOWER": "engagement"}]},
-    ]
-
-    ruler.add_patterns(patterns)
-
-# ---------------- SENTENCE TRANSFORMER ----------------
-model = SentenceTransformer("all-MiniLM-L6-v2")
-
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt")
-
-try:
-    nltk.data.find("tokenizers/punkt_tab")
-except LookupError:
-    nltk.download("punkt_tab")
+embedding_cache = EmbeddingCache(ENCODER_KEY)
+document_cache = DocumentCache()
 
 # ---------------- CONFIG ----------------
 IMPORTANCE_KEYWORDS = {
@@ -110,77 +23,166 @@ IMPORTANCE_KEYWORDS = {
 }
 
 SIMILARITY_THRESHOLD = 0.55
+# Sentences longer than the encoder's input window are truncated, so their
+# weight in the document embedding is capped the same way
+MAX_SENTENCE_TOKENS = 256
 
 # ---------------- UTILS ----------------
+@traced("extraction")
 def extract_text_from_pdf(file):
-    text = ""
-    file.seek(0)
-    with fitz.open(stream=file.read(), filetype="pdf") as doc:
-        for page in doc:
-            text += page.get_text()
-    return text
+    return extract_pdf_text(file)
 
 
+@traced("extraction")
 def extract_text_from_docx(file):
-    file.seek(0)
-    doc = docx.Document(file)
-    return "\n".join([para.text for para in doc.paragraphs])
+    return "\n".join(iter_docx_paragraphs(file))
 
 
+@traced("cleaning")
 def clean_text(text):
     text = text.lower()
     text = re.sub(r"\s+", " ", text)
     return text.strip()
 
 
+@traced("sentence_split")
+def split_sentences(text):
+    ensure_nltk_data()
+    return nltk.sent_tokenize(text)
+
+
+@traced("skill_extraction")
 def extract_skill_phrases(sentence):
-    doc = nlp(sentence)
-    phrases = set()
+    # Only capture defined SKILL patterns
+    return get_skill_matcher().extract(sentence)
 
-    # Only capture defined SKILL entities
-    for ent in doc.ents:
-        if ent.label_ == "SKILL":
-            phrases.add(ent.text.lower())
 
-    return list(phrases)
+def parse_document(file, filename=None):
+    # Upload -> (sha256, {"text", "clean", "sentences"}); each unique file is
+    # extracted, cleaned and split once per server
+    data = read_upload(file)
+    name = (filename or getattr(file, "name", "")).lower()
 
+    def parse(data):
+        extract = extract_text_from_pdf if name.endswith(".pdf") else extract_text_from_docx
+        text = extract(io.BytesIO(data))
+        clean = clean_text(text)
+        return {"text": text, "clean": clean, "sentences": split_sentences(clean)}
 
-# ---------------- ENGINE ----------------
-def calculate_match_score(resume_text, jd_text):
-    resume_clean = clean_text(resume_text)
-    jd_clean = clean_text(jd_text)
+    return document_cache.get_or_parse(data, parse)
 
-    resume_sentences = nltk.sent_tokenize(resume_clean)
-    if not resume_sentences:
-        return 0, [], []
 
-    resume_embeddings = model.encode(resume_sentences, convert_to_tensor=True)
+def sentence_weight(sent):
+    weight = 2
+    for w, keywords in IMPORTANCE_KEYWORDS.items():
+        if any(kw in sent.lower() for kw in keywords):
+            weight = w
+    return weight
 
-    jd_sentences = nltk.sent_tokenize(jd_clean)
-    skill_dict = {}
 
-    for sent in jd_sentences:
-        weight = 2
-        for w, keywords in IMPORTANCE_KEYWORDS.items():
-            if any(kw in sent.lower() for kw in keywords):
-                weight = w
+@traced("embedding")
+def encode(texts, batch_size=128):
+    # Content-hash cached; repeat texts never reach the SentenceTransformer
+    return embedding_cache.encode(get_encoder(), texts, batch_size=batch_size)
 
-        phrases = extract_skill_phrases(sent)
 
-        for p in phrases:
-            skill_dict[p] = max(skill_dict.get(p, 0), weight)
+def skill_vectors(phrases):
+    # Precomputed taxonomy vectors; only phrases outside it reach the encoder
+    get_skill_vectors()
+    return get_skill_taxonomy().phrase_vectors(phrases, encode)
 
+
+def document_embedding(sentences, sentence_embeddings):
+    # Token-length weighted mean of the sentence embeddings: covers the whole
+    # document, where encoding it in one piece stops at the model's limit
+    weights = np.fromiter((min(len(sent.split()), MAX_SENTENCE_TOKENS) or 1 for sent in sentences),
+                          dtype=np.float32, count=len(sentences))
+    return weights @ np.asarray(sentence_embeddings, dtype=np.float32) / weights.sum()
+
+
+def embedding_cache_metrics():
+    return embedding_cache.stats()
+
+
+def document_cache_metrics():
+    return document_cache.stats()
+
+
+# ---------------- ENGINE ----------------
+def extract_jd_skills(jd_clean, sentences=None, cache=None):
+    # cache: optional sentence -> (weight, phrases in hit order), kept across
+    # JD edits by AnalysisSession; when every sentence is known the matcher
+    # pass is skipped
+    if sentences is None:
+        sentences = split_sentences(jd_clean)
+    if not sentences:
+        return {}
+
+    if cache is None or any(sent not in cache for sent in sentences):
+        # Sentence start offsets, so one matcher pass over the whole JD can be
+        # attributed back to the sentence (and importance weight) of each hit
+        starts, cursor = [], 0
+        for sent in sentences:
+            pos = jd_clean.find(sent, cursor)
+            if pos < 0:
+                pos = cursor
+            starts.append(pos)
+            cursor = pos + len(sent)
+
+        with span("skill_extraction"):
+            hits = get_skill_matcher().find(jd_clean)
+
+        per_sentence = [[] for _ in sentences]
+        for start, _, phrase in hits:
+            per_sentence[max(bisect_right(starts, start) - 1, 0)].append(phrase)
+        entries = [(sentence_weight(sent), phrases) for sent, phrases in zip(sentences, per_sentence)]
+        if cache is not None:
+            cache.update(zip(sentences, entries))
+    else:
+        entries = [cache[sent] for sent in sentences]
+
+    skill_dict = {}
+    for weight, phrases in entries:
+        for phrase in phrases:
+            skill_dict[phrase] = max(skill_dict.get(phrase, 0), weight)
+
+    return skill_dict
+
+
+def build_jd_profile(jd_text, skill_cache=None):
+    # Everything that depends only on the JD: parsed, tokenized and embedded once
+    jd_clean = clean_text(jd_text)
+    sentences = split_sentences(jd_clean)
+    skill_dict = extract_jd_skills(jd_clean, sentences, skill_cache)
+    phrases = list(skill_dict)
+
+    profile = {
+        "clean": jd_clean,
+        "skills": skill_dict,
+        "phrases": phrases,
+        "phrase_embeddings": None,
+        "embedding": None,
+    }
+    if phrases:
+        profile["phrase_embeddings"] = skill_vectors(phrases)
+        profile["embedding"] = document_embedding(sentences, encode(sentences))
+    return profile
+
+
+@traced("scoring")
+def score_resume(resume_clean, resume_embeddings, full_resume_emb, profile):
+    skill_dict = profile["skills"]
     if not skill_dict:
         return 0, [], []
 
     matched, missing = [], []
     total_w, matched_w = 0, 0
 
-    for phrase, weight in skill_dict.items():
-        phrase_embedding = model.encode(phrase, convert_to_tensor=True)
-        cos_scores = util.cos_sim(phrase_embedding, resume_embeddings)[0]
-        max_sim = cos_scores.max().item()
+    # Running max per phrase over sentence blocks; no phrase x sentence matrix
+    max_sims = max_cosine(profile["phrase_embeddings"], resume_embeddings).tolist()
 
+    for phrase, max_sim in zip(profile["phrases"], max_sims):
+        weight = skill_dict[phrase]
         total_w += weight
 
         if max_sim > SIMILARITY_THRESHOLD or phrase in resume_clean:
@@ -192,10 +194,74 @@ def calculate_match_score(resume_text, jd_text):
     skill_score = int((matched_w / total_w) * 100) if total_w > 0 else 0
 
     # Hybrid Score
-    full_resume_emb = model.encode(resume_clean, convert_to_tensor=True)
-    full_jd_emb = model.encode(jd_clean, convert_to_tensor=True)
-    semantic_overall = util.cos_sim(full_resume_emb, full_jd_emb).item()
+    semantic_overall = float(max_cosine(full_resume_emb, [profile["embedding"]])[0])
 
     final_score = int((skill_score * 0.7) + (semantic_overall * 30))
 
-    return min(100, final_score), matched, missing
\ No newline at end of file
+    return min(100, final_score), matched, missing
+
+
+def calculate_match_score(resume_text, jd_text):
+    resume_clean = clean_text(resume_text)
+
+    resume_sentences = split_sentences(resume_clean)
+    if not resume_sentences:
+        return 0, [], []
+
+    profile = build_jd_profile(jd_text)
+    if not profile["skills"]:
+        return 0, [], []
+
+    embeddings = encode(resume_sentences)
+
+    return score_resume(resume_clean, embeddings, document_embedding(resume_sentences, embeddings), profile)
+
+
+# ---------------- BULK SCREENING ----------------
+def _clean_and_split(resume):
+    # Raw text, or a parse_document result that already holds both
+    if isinstance(resume, dict):
+        return resume["clean"], resume["sentences"]
+    resume_clean = clean_text(resume)
+    return resume_clean, split_sentences(resume_clean)
+
+
+def screen_many(resumes, jd_text, batch_size=64, encode_batch_size=256):
+    # resumes: iterable of (candidate, raw_text or parsed document) pairs
+    profile = build_jd_profile(jd_text)
+    rows = []
+
+    resumes = list(resumes)
+    for start in range(0, len(resumes), batch_size):
+        chunk = resumes[start:start + batch_size]
+        cleaned, split = zip(*[_clean_and_split(resume) for _, resume in chunk])
+
+        if profile["skills"]:
+            # Sentences from every resume in the chunk go through the encoder together
+            flat = [sent for sentences in split for sent in sentences]
+            sentence_embeddings = encode(flat, batch_size=encode_batch_size)
+
+        offset = 0
+        for (candidate, _), resume_clean, sentences in zip(chunk, cleaned, split):
+            if not sentences or not profile["skills"]:
+                score, matched, missing = 0, [], []
+            else:
+                resume_embeddings = sentence_embeddings[offset:offset + len(sentences)]
+                doc_embedding = document_embedding(sentences, resume_embeddings)
+                score, matched, missing = score_resume(resume_clean, resume_embeddings, doc_embedding, profile)
+            offset += len(sentences)
+
+            rows.append({
+                "candidate": candidate,
+                "score": score,
+                "matched": matched,
+                "missing": missing,
+                "matched_count": len(matched),
+                "missing_count": len(missing),
+            })
+
+    columns = ["candidate", "score", "matched", "missing", "matched_count", "missing_count"]
+    ranked = pd.DataFrame(rows, columns=columns)
+    ranked = ranked.sort_values("score", ascending=False, kind="stable").reset_index(drop=True)
+    ranked.insert(0, "rank", range(1, len(ranked) + 1))
+    return ranked
@@ -1,12 +1,14 @@
-import fitz
-import docx
 import re
+from bisect import bisect_left
 import nltk
 from collections import Counter
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from document_parser import extract_pdf_text, iter_docx_paragraphs
+from tfidf_model import get_tfidf_model
+from models import get_skill_taxonomy
 
 # NLTK Data Download (Sirf ek baar handle karega)
 try:
@@ -27,35 +29,16 @@ IMPORTANCE_LEVELS = {
     1: ["nice to have"]
 }
 
-SKILL_ALIASES = {
-    "machine learning": ["ml", "machine-learning"],
-    "artificial intelligence": ["ai", "artificial-intelligence"],
-    "javascript": ["js", "javascript"],
-    "react": ["reactjs", "react.js", "react js"],
-    "nodejs": ["node.js", "node js", "node"],
-    "mongodb": ["mongo"],
-    "aws": ["amazon web services"],
-    "kubernetes": ["k8s"],
-    "natural language processing": ["nlp"]
-}
+# Canonical skill -> aliases, from the shared taxonomy (data/skills.json)
+SKILL_ALIASES = get_skill_taxonomy().alias_table()
 
 # -------- TEXT EXTRACTION --------
 
 def extract_text_from_pdf(file):
-    text = ""
-    file.seek(0) # Pointer reset
-    with fitz.open(stream=file.read(), filetype="pdf") as doc:
-        for page in doc:
-            text += page.get_text()
-    return text
+    return extract_pdf_text(file)
 
 def extract_text_from_docx(file):
-    file.seek(0) # Pointer reset
-    doc = docx.Document(file)
-    text = ""
-    for para in doc.paragraphs:
-        text += para.text + "\n"
-    return text
+    return "".join(para + "\n" for para in iter_docx_paragraphs(file))
 
 # -------- CLEANING & NORMALIZATION --------
 
@@ -64,12 +47,43 @@ def clean_text(text):
     text = re.sub(r'[^a-zA-Z0-9\s]', '', text)
     return text
 
+def _trie_regex(words):
+    # Prefix-sharing alternation: "node", "node js", "nodejs" -> node(?:(?: js|js))?
+    # Optional tails are greedy, so the longest alias at a position wins
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def walk(node):
+        alts = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if "" in node:
+            body = "(?:" + body + ")?"
+        return body
+
+    return walk(trie)
+
+def build_alias_normalizer(aliases):
+    # Compiled once from the alias table; rewrites a text in a single pass
+    lookup = {}
+    for standard_name, alias_list in aliases.items():
+        for alias in alias_list:
+            lookup.setdefault(alias.lower(), standard_name)
+    if not lookup:
+        return lambda text: text
+
+    pattern = re.compile(rf'\b(?:{_trie_regex(lookup)})\b', re.IGNORECASE)
+    return lambda text: pattern.sub(lambda m: lookup[m.group(0).lower()], text)
+
+_normalize = build_alias_normalizer(SKILL_ALIASES)
+
 def normalize_aliases(text):
-    for standard_name, aliases in SKILL_ALIASES.items():
-        for alias in aliases:
-            pattern = rf'\b{re.escape(alias)}\b'
-            text = re.sub(pattern, standard_name, text, flags=re.IGNORECASE)
-    return text
+    return _normalize(text)
 
 # -------- DYNAMIC SKILL EXTRACTION (SMART VERSION) --------
 
@@ -103,31 +117,92 @@ def extract_dynamic_skills(jd_text):
             
     return list(skills)
 
-# -------- MATCH SCORE ENGINE --------
+# -------- IMPORTANCE WEIGHTING --------
+
+PROXIMITY_WINDOW = 40
+
+def _occurrences(text, needle):
+    # All (overlapping) start offsets, like a regex scanning every position
+    starts = []
+    i = text.find(needle)
+    while i != -1:
+        starts.append(i)
+        i = text.find(needle, i + 1)
+    return starts
+
+def _any_between(sorted_offsets, lo, hi):
+    i = bisect_left(sorted_offsets, lo)
+    return i < len(sorted_offsets) and sorted_offsets[i] <= hi
+
+def importance_weights(skills, jd_processed):
+    # Same result as searching keyword(.{0,40})skill|skill(.{0,40})keyword for
+    # every skill x keyword, via sorted offset joins: a keyword ending at most
+    # 40 chars before a skill starts, or starting at most 40 chars after it
+    # ends, with no newline in between ('.' does not match newlines).
+    newlines = _occurrences(jd_processed, "\n")
+
+    level_offsets = {}
+    for level, keywords in IMPORTANCE_LEVELS.items():
+        starts, ends = [], []
+        for keyword in keywords:
+            hits = _occurrences(jd_processed, keyword)
+            starts.extend(hits)
+            ends.extend(h + len(keyword) for h in hits)
+        level_offsets[level] = (sorted(starts), sorted(ends))
+
+    weights = {}
+    for skill in skills:
+        occurrences = _occurrences(jd_processed, skill)
+        windows = []
+        for start in occurrences:
+            end = start + len(skill)
+            i = bisect_left(newlines, start)
+            line_start = newlines[i - 1] + 1 if i > 0 else 0
+            j = bisect_left(newlines, end)
+            line_end = newlines[j] if j < len(newlines) else len(jd_processed)
+            windows.append((max(start - PROXIMITY_WINDOW, line_start), start,
+                            end, min(end + PROXIMITY_WINDOW, line_end)))
 
-def calculate_match_score(resume_text, jd_text):
-    # 1. Standardize Text
-    resume_processed = normalize_aliases(clean_text(resume_text))
-    jd_processed = normalize_aliases(clean_text(jd_text))
+        weight = 2
+        for level, (kw_starts, kw_ends) in level_offsets.items():
+            # Later levels override earlier ones, as in the original loop
+            if any(_any_between(kw_ends, before_lo, before_hi) or _any_between(kw_starts, after_lo, after_hi)
+                   for before_lo, before_hi, after_lo, after_hi in windows):
+                weight = level
+        weights[skill] = weight
+
+    return weights
+
+# -------- SEMANTIC SIMILARITY --------
+
+def semantic_scores(resumes_processed, jd_processed, tfidf_model=None):
+    tfidf_model = tfidf_model or get_tfidf_model()
+    if tfidf_model is not None:
+        # Corpus IDF: transform only, one sparse product for every resume
+        return [int(s * 100) for s in tfidf_model.similarities(resumes_processed, jd_processed)]
+
+    # No corpus model fitted yet: fall back to a per-pair fit
+    scores = []
+    for resume_processed in resumes_processed:
+        try:
+            vectorizer = TfidfVectorizer()
+            vectors = vectorizer.fit_transform([resume_processed, jd_processed])
+            similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
+            scores.append(int(similarity * 100))
+        except:
+            scores.append(0)
+    return scores
 
-    # 2. Extract Smart Skills
-    skills = extract_dynamic_skills(jd_processed)
+# -------- MATCH SCORE ENGINE --------
 
+def _skill_breakdown(resume_processed, skills, weights):
     matched = []
     missing = []
     total_weight = 0
     matched_weight = 0
 
-    # 3. Weighted Matching Logic
     for skill in skills:
-        weight = 2
-        for level, keywords in IMPORTANCE_LEVELS.items():
-            for keyword in keywords:
-                # Contextual weighting (Proximity match)
-                pattern = rf"{keyword}(.{{0,40}}){re.escape(skill)}|{re.escape(skill)}(.{{0,40}}){keyword}"
-                if re.search(pattern, jd_processed):
-                    weight = level
-
+        weight = weights[skill]
         total_weight += weight
 
         if skill in resume_processed:
@@ -138,17 +213,31 @@ def calculate_match_score(resume_text, jd_text):
 
     # Calculate weighted skill score
     skill_score = int((matched_weight / total_weight) * 100) if total_weight != 0 else 0
+    return skill_score, matched, missing
+
+def calculate_match_score(resume_text, jd_text, tfidf_model=None):
+    return score_many([resume_text], jd_text, tfidf_model)[0]
+
+def score_many(resume_texts, jd_text, tfidf_model=None):
+    # 1. Standardize Text
+    resumes_processed = [normalize_aliases(clean_text(text)) for text in resume_texts]
+    jd_processed = normalize_aliases(clean_text(jd_text))
+
+    # 2. Extract Smart Skills (once per JD)
+    skills = extract_dynamic_skills(jd_processed)
+
+    # 3. Weighted Matching Logic
+    weights = importance_weights(skills, jd_processed)
 
     # 4. Semantic Analysis
-    try:
-        vectorizer = TfidfVectorizer()
-        vectors = vectorizer.fit_transform([resume_processed, jd_processed])
-        similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
-        semantic_score = int(similarity * 100)
-    except:
-        semantic_score = 0
-
-    # Hybrid Final Score
-    final_score = int((skill_score * 0.6) + (semantic_score * 0.4))
-
-    return final_score, matched, missing
\ No newline at end of file
+    semantic = semantic_scores(resumes_processed, jd_processed, tfidf_model)
+
+    results = []
+    for resume_processed, semantic_score in zip(resumes_processed, semantic):
+        skill_score, matched, missing = _skill_breakdown(resume_processed, skills, weights)
+
+        # Hybrid Final Score
+        final_score = int((skill_score * 0.6) + (semantic_score * 0.4))
+        results.append((final_score, matched, missing))
+
+    return results
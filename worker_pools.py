@@ -0,0 +1,45 @@
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Process pools shared by the whole process (PDF page extraction, report
+# rendering), created on first use. Spawned, not forked, so workers never
+# inherit torch's thread pools. Streamlit runs every session in its own
+# thread, hence the lock. A pool broken by a dead worker (e.g. OOM-killed)
+# is evicted and recreated instead of failing every later call.
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def get_pool(name, workers):
+    with _lock:
+        pool, size = _pools.get(name, (None, 0))
+        if pool is None or size != workers or getattr(pool, "_broken", False):
+            if pool is not None:
+                # Work already submitted by another session still completes
+                pool.shutdown(wait=False)
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pools[name] = (pool, workers)
+        return pool
+
+
+def _evict(name, pool):
+    with _lock:
+        if _pools.get(name, (None, 0))[0] is pool:
+            del _pools[name]
+    pool.shutdown(wait=False)
+
+
+def pool_map(name, workers, fn, *iterables, chunksize=1):
+    # Ordered results like map(); on a broken pool the whole map is retried
+    # once on a fresh pool, then run sequentially in this process
+    iterables = [list(items) for items in iterables]
+    for _ in range(2):
+        pool = get_pool(name, workers)
+        try:
+            return list(pool.map(fn, *iterables, chunksize=chunksize))
+        except BrokenProcessPool:
+            _evict(name, pool)
+    return list(map(fn, *iterables))